@@ -0,0 +1,30 @@
+"""Compatibility helpers and optional dependencies used to speed up GramBotPy.
+
+Every optional package defined here is ``None`` when it is not installed,
+so callers can keep a pure-Python fallback.
+"""
+
+import sys
+
+# ``@dataclass(**DATACLASS_SLOTS)`` stores fields in slots on Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
\ No newline at end of file
@@ -8,10 +8,32 @@ from datetime import datetime
 import aiohttp
 import json
 
+from ._compat import uvloop
 from .dispatcher import Dispatcher
 from .methods import Methods
 from .session import Session
 from .types import User
+from .utils.serialization import dumps, loads
+
+
+class _SharedSession:
+    """Async context manager yielding the client's shared aiohttp session.
+    
+    Unlike ``aiohttp.ClientSession`` itself, leaving the block does not close
+    the session, so its pooled connections are reused by the next request.
+    """
+    
+    __slots__ = ("client",)
+    
+    def __init__(self, client: "GramBotPy"):
+        self.client = client
+        
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        return self.client._get_http_session()
+    
+    async def __aexit__(self, *args) -> None:
+        pass
+
 
 class GramBotPy(Methods):
     """GramBotPy Client - A Telegram Bot API framework
@@ -48,12 +70,28 @@ class GramBotPy(Methods):
         workers (``int``, optional):
             Number of workers for handling updates. Defaults to 4.
             
+        pool_messages (``bool``, optional):
+            Reuse :obj:`Message` objects once all handlers of an update have finished.
+            The incoming message and the messages it replies to are cleared at that point:
+            handlers, and any task they start (``asyncio.create_task``, delayed edits...),
+            must not keep references to them after returning. Defaults to False.
+            
+        pool_size (``int``, optional):
+            Maximum number of simultaneous connections kept open to the Bot API.
+            Defaults to 100.
+            
     """
 
     APP_VERSION = f"GramBotPy 0.1.0"
     DEVICE_MODEL = f"{platform.python_implementation()} {platform.python_version()}"
     SYSTEM_VERSION = f"{platform.system()} {platform.release()}"
     
+    # Message types accepted by message_handler(), each named after the Message attribute it checks
+    MESSAGE_TYPES = frozenset((
+        "text", "photo", "video", "audio", "sticker", "document",
+        "contact", "location", "new_chat_members"
+    ))
+    
     def __init__(
         self,
         token: str,
@@ -64,7 +102,9 @@ class GramBotPy(Methods):
         proxy: dict = None,
         timeout: int = 10,
         max_retries: int = 5,
-        workers: int = 4
+        workers: int = 4,
+        pool_messages: bool = False,
+        pool_size: int = 100
     ):
         super().__init__()
         
@@ -85,6 +125,7 @@ class GramBotPy(Methods):
         self.timeout = timeout
         self.max_retries = max_retries
         self.workers = workers
+        self.pool_size = pool_size
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
@@ -92,14 +133,25 @@ class GramBotPy(Methods):
         # Initialize session
         self._session = Session(self.session)
         
+        # HTTP session shared by all API calls, created on first use
+        self._http: typing.Optional[aiohttp.ClientSession] = None
+        
+        # Set when the bot disconnects, awaited by idle()
+        self._idle_event: typing.Optional[asyncio.Event] = None
+        
         # Initialize dispatcher for handling updates
-        self._dispatcher = Dispatcher(self, workers)
+        self._dispatcher = Dispatcher(self, workers, pool_messages)
         
         # Initialized flag
         self._is_initialized = False
         self._is_connected = False
         self._me = None
         
+    @property
+    def is_connected(self) -> bool:
+        """``bool``: True once :meth:`start` has completed and until the bot is stopped."""
+        return self._is_connected
+    
     async def start(self) -> "GramBotPy":
         """Start the bot.
         
@@ -154,6 +206,8 @@ class GramBotPy(Methods):
         # Here would be the actual disconnection logic
         
         self._is_connected = False
+        if self._idle_event is not None:
+            self._idle_event.set()
         return True
     
     async def sign_in_bot(self, bot_token: str) -> User:
@@ -185,16 +239,7 @@ class GramBotPy(Methods):
         Returns:
             Callable: The decorator.
         """
-        def command_filter(message):
-            if not message.text:
-                return False
-            parts = message.text.split()
-            if not parts:
-                return False
-            # Check if the first part of the message is the command
-            return parts[0] == f"/{command_name}" or parts[0] == f"/{command_name}@{self._me.username}"
-        
-        return self.on_message(command_filter)
+        return self._dispatcher.on_command(command_name)
     
     def on_message(self, filters=None):
         """Decorator for handling messages.
@@ -243,26 +288,14 @@ class GramBotPy(Methods):
         Returns:
             Callable: The decorator.
         """
-        def message_filter(message):
-            if message_type == "text" and message.text:
-                return True
-            elif message_type == "photo" and message.photo:
-                return True
-            elif message_type == "video" and message.video:
-                return True
-            elif message_type == "audio" and message.audio:
-                return True
-            elif message_type == "sticker" and message.sticker:
-                return True
-            elif message_type == "document" and message.document:
-                return True
-            elif message_type == "contact" and message.contact:
-                return True
-            elif message_type == "location" and message.location:
-                return True
-            elif message_type == "new_chat_members" and message.new_chat_members:
-                return True
-            return False
+        # The type is resolved here, once, instead of walking a chain of
+        # comparisons for every message
+        if message_type not in self.MESSAGE_TYPES:
+            def message_filter(message):
+                return False
+        else:
+            def message_filter(message):
+                return bool(getattr(message, message_type))
         
         return self.on_message(message_filter)
     
@@ -335,12 +368,34 @@ class GramBotPy(Methods):
     async def idle(self):
         """Idle the bot.
         
-        This method keeps the bot running until stop() is called.
+        This method keeps the bot running until stop() is called or the
+        process receives SIGINT or SIGTERM.
         """
+        # Wait on an event instead of polling, so the loop sleeps until
+        # something actually happens
+        self._idle_event = asyncio.Event()
+        loop = asyncio.get_event_loop()
+        
+        installed = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._idle_event.set)
+                installed.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Windows doesn't support add_signal_handler
+                pass
+        
         try:
-            while self._is_connected:
-                await asyncio.sleep(1)
+            if self._is_connected:
+                await self._idle_event.wait()
         except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            for sig in installed:
+                loop.remove_signal_handler(sig)
+            self._idle_event = None
+        
+        if self._is_connected:
             await self.stop()
     
     def run(self):
@@ -348,8 +403,10 @@ class GramBotPy(Methods):
         
         This is a convenience method that calls `asyncio.run(bot.start())` 
         and sets up appropriate signal handlers for graceful shutdown.
+        The bot runs on a uvloop event loop when uvloop is installed.
         """
-        loop = asyncio.get_event_loop()
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
         
         # Set up signal handlers for graceful shutdown
         try:
@@ -379,6 +436,31 @@ class GramBotPy(Methods):
         This method disconnects from Telegram.
         """
         await self.disconnect()
+        
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use.
+        
+        The session keeps connections to the Bot API alive between calls, so
+        requests skip the TCP and TLS handshakes. It is closed by :meth:`stop`.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=75, ttl_dns_cache=300),
+                # Request bodies passed as json= are encoded with orjson when available
+                json_serialize=dumps
+            )
+        return self._http
+    
+    def _http_session(self) -> _SharedSession:
+        """Return a context manager for the shared aiohttp session.
+        
+        Use as ``async with self._http_session() as session:``.
+        """
+        return _SharedSession(self)
     
     async def __aenter__(self) -> "GramBotPy":
         """Enter the context manager.
@@ -412,10 +494,10 @@ class GramBotPy(Methods):
         if params is None:
             params = {}
         
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 async with session.post(url, json=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if result.get("ok"):
                         return result.get("result")
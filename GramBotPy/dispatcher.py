@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import inspect
 import typing
@@ -8,6 +9,22 @@ if typing.TYPE_CHECKING:
     from .client import GramBotPy
     from .types import Update, Message, CallbackQuery, InlineQuery, ChosenInlineResult
 
+class _Command:
+    """Filter of a message handler registered with :meth:`Dispatcher.on_command`.
+    
+    The dispatcher compares it with the command parsed once per message
+    instead of calling it like the other filters.
+    """
+    
+    __slots__ = ("command",)
+    
+    def __init__(self, command: str):
+        self.command = command
+        
+    def __repr__(self) -> str:
+        return f"_Command({self.command!r})"
+
+
 class Dispatcher:
     """Dispatcher for handling updates.
     
@@ -20,11 +37,29 @@ class Dispatcher:
             
         workers (``int``):
             Number of workers to use for handling updates.
+            
+        pool_messages (``bool``, optional):
+            Release messages back to the :obj:`Message` pool after their handlers finish,
+            even when a handler raises. The message and the messages it replies to are
+            then cleared and reused, so it cannot be combined with handlers that keep
+            them, for example in background tasks started with ``asyncio.create_task``.
+            
+        max_concurrent_updates (``int``, optional):
+            Maximum number of updates processed at the same time. Polling waits for
+            a running update to finish once the limit is reached. Defaults to 256.
     """
     
-    def __init__(self, client: "GramBotPy", workers: int = 4):
+    def __init__(
+        self,
+        client: "GramBotPy",
+        workers: int = 4,
+        pool_messages: bool = False,
+        max_concurrent_updates: int = 256
+    ):
         self.client = client
         self.workers = workers
+        self.pool_messages = pool_messages
+        self.max_concurrent_updates = max_concurrent_updates
         self.logger = logging.getLogger(__name__)
         
         self.message_handlers = []
@@ -37,6 +72,11 @@ class Dispatcher:
         self._executor = None
         self._running = False
         self._update_handler_task = None
+        # Strong references to the running process_update tasks, the event
+        # loop only keeps weak ones
+        self._update_tasks = set()
+        # Bounds _update_tasks, created in start() so it binds to the running loop
+        self._update_semaphore = None
         
     async def start(self):
         """Start the dispatcher."""
@@ -46,6 +86,7 @@ class Dispatcher:
         self._loop = asyncio.get_event_loop()
         self._executor = ThreadPoolExecutor(max_workers=self.workers)
         self._running = True
+        self._update_semaphore = asyncio.Semaphore(self.max_concurrent_updates)
         
         # Start update handler
         self._update_handler_task = asyncio.create_task(self._update_handler())
@@ -60,6 +101,9 @@ class Dispatcher:
         if self._update_handler_task:
             self._update_handler_task.cancel()
             
+        for task in self._update_tasks:
+            task.cancel()
+            
         if self._executor:
             self._executor.shutdown()
             
@@ -72,9 +116,15 @@ class Dispatcher:
                 # Get updates from the client with the last_update_id + 1 as offset
                 updates = await self.client.get_updates(offset=last_update_id + 1 if last_update_id else None)
                 
-                # Process each update
+                # Process each update in its own task so slow handlers don't hold up polling
                 for update in updates:
-                    asyncio.create_task(self.process_update(update))
+                    # The task releases the semaphore it acquired, even if a
+                    # restart has replaced self._update_semaphore meanwhile
+                    semaphore = self._update_semaphore
+                    await semaphore.acquire()
+                    task = asyncio.create_task(self.process_update(update))
+                    self._update_tasks.add(task)
+                    task.add_done_callback(functools.partial(self._update_task_done, semaphore))
                     # Update the last_update_id
                     if update.update_id > last_update_id:
                         last_update_id = update.update_id
@@ -88,6 +138,11 @@ class Dispatcher:
                 self.logger.error(f"Error while handling updates: {e}", exc_info=True)
                 await asyncio.sleep(1)
                 
+    def _update_task_done(self, semaphore: asyncio.Semaphore, task: asyncio.Task):
+        """Forget a finished process_update task and free its slot in ``semaphore``."""
+        self._update_tasks.discard(task)
+        semaphore.release()
+        
     async def process_update(self, update: "Update"):
         """Process a single update.
         
@@ -96,16 +151,25 @@ class Dispatcher:
                 The update to process.
         """
         try:
-            if update.message:
-                await self.process_message(update.message)
+            message = update.message
+            if message:
+                try:
+                    await self.process_message(message)
+                finally:
+                    if self.pool_messages:
+                        # Unlink the message from the update before it is cleared and reused
+                        update.message = None
+                        message._release()
             elif update.callback_query:
                 await self.process_callback_query(update.callback_query)
             elif update.inline_query:
                 await self.process_inline_query(update.inline_query)
             elif update.chosen_inline_result:
                 await self.process_chosen_inline_result(update.chosen_inline_result)
-            elif hasattr(update, 'game_query'):
-                await self.process_game_query(update.game_query)
+            else:
+                game_query = getattr(update, 'game_query', None)
+                if game_query:
+                    await self.process_game_query(game_query)
         except Exception as e:
             self.logger.error(f"Error while processing update: {e}")
             
@@ -116,8 +180,26 @@ class Dispatcher:
             message (:obj:`Message`):
                 The message to process.
         """
+        text = message.text
+        command = None
+        if text and text.startswith("/"):
+            # The command is parsed once per message instead of once per
+            # registered command handler
+            parts = text.split(None, 1)
+            command = parts[0]
+            message.command_args = parts[1] if len(parts) > 1 else ""
+            if "@" in command:
+                command, _, username = command.partition("@")
+                me = await self.client.get_me()
+                if username != me.username:
+                    command = None
+                    
         for handler, filters in self.message_handlers:
-            if await self._check_filters(filters, message):
+            if filters.__class__ is _Command:
+                matched = filters.command == command
+            else:
+                matched = await self._check_filters(filters, message)
+            if matched:
                 try:
                     if inspect.iscoroutinefunction(handler):
                         await handler(message)
@@ -251,6 +333,23 @@ class Dispatcher:
             return func
         return decorator
         
+    def on_command(self, command_name):
+        """Decorator for handling bot commands.
+        
+        Command handlers run in registration order with the other message handlers.
+        
+        Parameters:
+            command_name (``str``):
+                The command name without the leading slash.
+            
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(func):
+            self.message_handlers.append((func, _Command(f"/{command_name}")))
+            return func
+        return decorator
+        
     def on_callback_query(self, filters=None):
         """Decorator for handling callback queries.
         
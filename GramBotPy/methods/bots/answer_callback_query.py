@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Optional
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -71,7 +72,7 @@ class AnswerCallbackQuery:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/answerCallbackQuery"
                 
@@ -83,7 +84,7 @@ class AnswerCallbackQuery:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
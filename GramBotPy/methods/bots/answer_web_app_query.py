@@ -4,6 +4,7 @@ import typing
 import aiohttp
 import json
 
+from ...utils.serialization import loads
 from ...types import SentWebAppMessage
 
 if typing.TYPE_CHECKING:
@@ -53,11 +54,11 @@ class AnswerWebAppQuery:
         }
         
         # Make the API request to answer the web app query
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/answerWebAppQuery"
                 async with session.post(url, data=params) as response:
-                    result_json = await response.json()
+                    result_json = loads(await response.read())
                     
                     if not result_json.get("ok", False):
                         error_description = result_json.get('description', 'Unknown error')
@@ -69,7 +70,7 @@ class AnswerWebAppQuery:
                     
                     # Parse the response and create a SentWebAppMessage object
                     message_data = result_json.get("result", {})
-                    return SentWebAppMessage._parse(self, message_data)
+                    return SentWebAppMessage._parse(message_data)
                     
             except aiohttp.ClientError as e:
                 self.logger.error(f"Network error making request to Telegram API: {e}", exc_info=True)
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 import typing
 import aiohttp
 import json
 
 from ...types import User
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -29,13 +31,25 @@ class GetMe:
                     print(f"Bot username: @{me.username}")
         """
         # Return cached value if available
-        if hasattr(self, '_me') and self._me is not None:
-            return self._me
-            
+        me = getattr(self, "_me", None)
+        if me is not None:
+            return me
+        
+        # Concurrent first calls wait for a single getMe request
+        lock = getattr(self, "_me_lock", None)
+        if lock is None:
+            lock = self._me_lock = asyncio.Lock()
+        async with lock:
+            if getattr(self, "_me", None) is None:
+                await self._request_me()
+        return self._me
+    
+    async def _request_me(self: "GramBotPy") -> User:
+        """Request the bot information from the API and store it in ``_me``."""
         self.logger.info("Getting information about the bot")
         
         # Make the API request to get bot information
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getMe"
                 
@@ -48,7 +62,7 @@ class GetMe:
                         return self._me
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
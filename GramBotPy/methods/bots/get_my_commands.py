@@ -2,8 +2,8 @@ import asyncio
 import logging
 import typing
 import aiohttp
-import json
 
+from ...utils.serialization import dumps, loads
 from ...types import BotCommand, BotCommandScope
 
 if typing.TYPE_CHECKING:
@@ -53,17 +53,17 @@ class GetMyCommands:
         
         # Add optional parameters if they are provided
         if scope is not None:
-            params["scope"] = json.dumps(scope.to_dict())
+            params["scope"] = dumps(scope)
             
         if language_code is not None:
             params["language_code"] = language_code
         
         # Make the API request to get the bot commands
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getMyCommands"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -5,6 +5,7 @@ import aiohttp
 import json
 
 from ...types import BotDescription
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -46,11 +47,11 @@ class GetMyDescription:
             params["language_code"] = language_code
         
         # Make the API request to get the bot description
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getMyDescription"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
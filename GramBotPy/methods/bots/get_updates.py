@@ -6,6 +6,8 @@ import aiohttp
 import json
 import time
 
+from ...utils.serialization import loads
+
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
     from ...types import Update
@@ -82,7 +84,7 @@ class GetUpdates:
         from ...types import Update
         
         start_time = time.time()
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getUpdates"
                 
@@ -94,7 +96,7 @@ class GetUpdates:
                         return []
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -105,7 +107,7 @@ class GetUpdates:
                     updates = []
                     for update_data in result.get("result", []):
                         try:
-                            updates.append(Update._parse(self, update_data))
+                            updates.append(Update._parse_fast(self, update_data))
                         except Exception as e:
                             self.logger.error(f"Error parsing update {update_data.get('update_id', 'unknown')}: {e}", exc_info=True)
                     
@@ -4,6 +4,7 @@ import typing
 import aiohttp
 import json
 
+from ...utils.serialization import dumps, loads
 from ...types import BotCommand, BotCommandScope
 
 if typing.TYPE_CHECKING:
@@ -82,17 +83,17 @@ class SetMyCommands:
         
         # Add optional parameters if they are provided
         if scope is not None:
-            params["scope"] = json.dumps(scope.to_dict())
+            params["scope"] = dumps(scope)
             
         if language_code is not None:
             params["language_code"] = language_code
         
         # Make the API request to set the bot commands
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/setMyCommands"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
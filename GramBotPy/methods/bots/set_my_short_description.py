@@ -3,6 +3,7 @@ import logging
 import typing
 import aiohttp
 import json
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -57,11 +58,11 @@ class SetMyShortDescription:
             params["language_code"] = language_code
         
         # Make the API request to set the bot short description
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/setMyShortDescription"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
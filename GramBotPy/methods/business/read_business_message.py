@@ -3,6 +3,7 @@ import logging
 import typing
 import aiohttp
 import json
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -47,11 +48,11 @@ class ReadBusinessMessage:
         }
         
         # Make the API request to mark the message as read
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/readBusinessMessage"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
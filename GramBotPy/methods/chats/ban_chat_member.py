@@ -3,6 +3,7 @@ import aiohttp
 import json
 from typing import Union, Optional
 from datetime import datetime
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -14,7 +15,7 @@ class BanChatMember:
         self: "GramBotPy",
         chat_id: Union[int, str],
         user_id: int,
-        until_date: Optional[datetime] = None,
+        until_date: Optional[Union[int, datetime]] = None,
         revoke_messages: Optional[bool] = None
     ) -> bool:
         """Ban a user from a chat.
@@ -26,7 +27,7 @@ class BanChatMember:
             user_id (``int``):
                 Unique identifier of the target user.
                 
-            until_date (:py:obj:`~datetime.datetime`, optional):
+            until_date (``int`` | :py:obj:`~datetime.datetime`, optional):
                 Date when the user will be unbanned. If not specified, the user will be banned forever.
                 
             revoke_messages (``bool``, optional):
@@ -42,8 +43,8 @@ class BanChatMember:
                 await bot.ban_chat_member(chat_id, user_id)
                 
                 # Ban a user for 24 hours
-                from datetime import datetime, timedelta
-                ban_until = datetime.now() + timedelta(days=1)
+                import time
+                ban_until = int(time.time()) + 86400
                 await bot.ban_chat_member(chat_id, user_id, until_date=ban_until)
         """
         self.logger.info(f"Banning user {user_id} from chat {chat_id}")
@@ -54,9 +55,9 @@ class BanChatMember:
             "user_id": user_id
         }
         
-        # Convert datetime to Unix timestamp if provided
+        # Convert datetime to Unix timestamp if provided, ints are passed as is
         if until_date:
-            until_date_ts = int(until_date.timestamp())
+            until_date_ts = int(until_date.timestamp()) if isinstance(until_date, datetime) else until_date
             params["until_date"] = until_date_ts
             self.logger.info(f"Ban until: {until_date} ({until_date_ts})")
         
@@ -77,7 +78,7 @@ class BanChatMember:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/banChatMember"
                 
@@ -89,7 +90,7 @@ class BanChatMember:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
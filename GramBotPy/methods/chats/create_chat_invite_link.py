@@ -6,6 +6,7 @@ import json
 from datetime import datetime
 
 from ...types import ChatInviteLink
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -107,11 +108,11 @@ class CreateChatInviteLink:
             params["creates_join_request"] = creates_join_request
         
         # Make the API request to create the chat invite link
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/createChatInviteLink"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
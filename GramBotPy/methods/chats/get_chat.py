@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Union, Dict, Any, Optional
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -37,7 +38,7 @@ class GetChat:
         }
         
         # Make the API request
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getChat"
                 
@@ -49,7 +50,7 @@ class GetChat:
                         return self._get_fallback_chat(chat_id)
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
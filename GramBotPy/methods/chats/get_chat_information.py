@@ -1,8 +1,8 @@
 import typing
 import json
-import aiohttp
 from typing import Union, Optional, Dict, Any
 from datetime import datetime
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -109,7 +109,7 @@ class GetChatInformation:
         try:
             params = {"chat_id": chat_id}
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 url = f"https://api.telegram.org/bot{self.token}/getChatMemberCount"
                 
                 async with session.post(url, data=params) as response:
@@ -117,7 +117,7 @@ class GetChatInformation:
                         self.logger.error(f"HTTP error {response.status} when getting member count: {await response.text()}")
                         return None
                     
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         self.logger.error(f"Error getting member count: {result.get('description', 'Unknown error')}")
@@ -138,7 +138,7 @@ class GetChatInformation:
         try:
             params = {"chat_id": chat_id}
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 url = f"https://api.telegram.org/bot{self.token}/getChatAdministrators"
                 
                 async with session.post(url, data=params) as response:
@@ -146,7 +146,7 @@ class GetChatInformation:
                         self.logger.error(f"HTTP error {response.status} when getting administrators: {await response.text()}")
                         return []
                     
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         self.logger.error(f"Error getting administrators: {result.get('description', 'Unknown error')}")
@@ -192,7 +192,7 @@ class GetChatInformation:
         try:
             params = {"chat_id": chat_id}
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 url = f"https://api.telegram.org/bot{self.token}/exportChatInviteLink"
                 
                 async with session.post(url, data=params) as response:
@@ -200,7 +200,7 @@ class GetChatInformation:
                         self.logger.debug(f"HTTP error {response.status} when getting invite link: {await response.text()}")
                         return None
                     
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         self.logger.debug(f"Error getting invite link: {result.get('description', 'Unknown error')}")
@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Union, Dict, Any
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -53,7 +54,7 @@ class GetChatMember:
         Returns:
             ``dict``: On success, a chat member object is returned.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getChatMember"
                 
@@ -65,7 +66,7 @@ class GetChatMember:
                         return self._get_fallback_chat_member(params.get("user_id", 0))
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
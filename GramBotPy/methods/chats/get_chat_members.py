@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Union, List, Dict, Any, Optional
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -75,7 +76,7 @@ class GetChatMembers:
         Returns:
             ``list``: List of administrator objects.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getChatAdministrators"
                 
@@ -87,7 +88,7 @@ class GetChatMembers:
                         return self._get_fallback_members(params.get("chat_id", 0), "administrators")
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
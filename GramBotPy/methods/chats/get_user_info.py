@@ -1,10 +1,10 @@
 import typing
 import json
-import aiohttp
 from typing import Union, Optional, Dict, Any
 from datetime import datetime
 
 from ...types import User, ChatMember
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -151,7 +151,7 @@ class GetUserInfo:
                 "limit": 10  # Get up to 10 recent photos
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 url = f"https://api.telegram.org/bot{self.token}/getUserProfilePhotos"
                 
                 async with session.post(url, data=params) as response:
@@ -159,7 +159,7 @@ class GetUserInfo:
                         self.logger.error(f"HTTP error {response.status} when getting profile photos: {await response.text()}")
                         return {"error": "Failed to fetch profile photos", "count": 0, "photos": []}
                     
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         return {"error": result.get("description", "Unknown error"), "count": 0, "photos": []}
@@ -5,6 +5,7 @@ from typing import Union, Optional
 from datetime import datetime, timedelta
 
 from ...types import ChatMember
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -89,7 +90,7 @@ class MuteChatMember:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/restrictChatMember"
                 
@@ -100,7 +101,7 @@ class MuteChatMember:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
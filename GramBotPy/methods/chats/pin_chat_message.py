@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Union, Optional
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -64,7 +65,7 @@ class PinChatMessage:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/pinChatMessage"
                 
@@ -76,7 +77,7 @@ class PinChatMessage:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -2,6 +2,7 @@ import typing
 import aiohttp
 import json
 from typing import Union, Optional
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -160,7 +161,7 @@ class PromoteChatMember:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/promoteChatMember"
                 
@@ -172,7 +173,7 @@ class PromoteChatMember:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
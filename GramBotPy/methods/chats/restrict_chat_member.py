@@ -3,6 +3,7 @@ import aiohttp
 import json
 from typing import Union, Optional, Dict, Any
 from datetime import datetime
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -15,7 +16,7 @@ class RestrictChatMember:
         chat_id: Union[int, str],
         user_id: int,
         permissions: Dict[str, bool],
-        until_date: Optional[datetime] = None
+        until_date: Optional[Union[int, datetime]] = None
     ) -> bool:
         """Restrict a user in a supergroup.
         
@@ -37,7 +38,7 @@ class RestrictChatMember:
                     - can_invite_users (``bool``, optional)
                     - can_pin_messages (``bool``, optional)
                 
-            until_date (:py:obj:`~datetime.datetime`, optional):
+            until_date (``int`` | :py:obj:`~datetime.datetime`, optional):
                 Date when restrictions will be lifted. If not specified, 
                 restrictions will be applied forever.
                 
@@ -61,8 +62,8 @@ class RestrictChatMember:
                 await bot.restrict_chat_member(chat_id, user_id, permissions)
                 
                 # Restrict a user for 24 hours
-                from datetime import datetime, timedelta
-                restrict_until = datetime.now() + timedelta(days=1)
+                import time
+                restrict_until = int(time.time()) + 86400
                 await bot.restrict_chat_member(chat_id, user_id, permissions, until_date=restrict_until)
         """
         self.logger.info(f"Restricting user {user_id} in chat {chat_id}")
@@ -75,9 +76,9 @@ class RestrictChatMember:
             "permissions": json.dumps(permissions)
         }
         
-        # Convert datetime to Unix timestamp if provided
+        # Convert datetime to Unix timestamp if provided, ints are passed as is
         if until_date:
-            until_date_ts = int(until_date.timestamp())
+            until_date_ts = int(until_date.timestamp()) if isinstance(until_date, datetime) else until_date
             params["until_date"] = until_date_ts
             self.logger.info(f"Restrict until: {until_date} ({until_date_ts})")
         
@@ -94,7 +95,7 @@ class RestrictChatMember:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/restrictChatMember"
                 
@@ -106,7 +107,7 @@ class RestrictChatMember:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Union, Optional
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -59,7 +60,7 @@ class UnpinChatMessage:
         Returns:
             ``bool``: True on success.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/unpinChatMessage"
                 
@@ -71,7 +72,7 @@ class UnpinChatMessage:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -115,7 +116,7 @@ class UnpinChatMessage:
         }
         
         # Make the API request
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/unpinAllChatMessages"
                 
@@ -127,7 +128,7 @@ class UnpinChatMessage:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -62,6 +62,35 @@ class Collection:
             created_at=datetime.now()
         )
     
+    async def insert_many(self, documents: typing.List[dict]) -> typing.List[Document]:
+        """Insert several documents into the collection.
+        
+        The documents are sent concurrently, so their message IDs are not
+        guaranteed to follow the order of ``documents``.
+        
+        Parameters:
+            documents (List of ``dict``):
+                The data of each document to insert.
+                
+        Returns:
+            List of :obj:`Document`: The inserted documents, in the same order as ``documents``.
+            Documents that failed to insert are ``None``.
+        """
+        self.logger.info(f"Inserting {len(documents)} documents into {self.name}")
+        
+        results = await asyncio.gather(
+            *(self.insert_one(data) for data in documents),
+            return_exceptions=True
+        )
+        
+        inserted = []
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to insert document: {result}")
+                result = None
+            inserted.append(result)
+        return inserted
+    
     async def find_one(self, filter_query: dict = None) -> Document:
         """Find a document in the collection.
         
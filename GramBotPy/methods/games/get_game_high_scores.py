@@ -6,6 +6,7 @@ import aiohttp
 import json
 
 from ...types import GameHighScore
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -78,11 +79,11 @@ class GetGameHighScores:
             raise ValueError("Either inline_message_id or both chat_id and message_id must be provided")
         
         # Make the API request to get the game high scores
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/getGameHighScores"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -5,6 +5,7 @@ from datetime import datetime
 import aiohttp
 import json
 
+from ...utils.serialization import loads
 from ...types import Message
 
 if typing.TYPE_CHECKING:
@@ -94,11 +95,11 @@ class SetGameScore:
             raise ValueError("Either inline_message_id or both chat_id and message_id must be provided")
         
         # Make the API request to set the game score
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/setGameScore"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
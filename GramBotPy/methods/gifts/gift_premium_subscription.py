@@ -5,6 +5,7 @@ from datetime import datetime
 import aiohttp
 import json
 
+from ...utils.serialization import loads
 from ...types import Message
 
 if typing.TYPE_CHECKING:
@@ -69,11 +70,11 @@ class GiftPremiumSubscription:
             params["disable_notification"] = disable_notification
         
         # Make the API request to gift the premium subscription
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/giftPremiumSubscription"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -5,6 +5,7 @@ from datetime import datetime
 import aiohttp
 import json
 
+from ...utils.serialization import loads
 from ...types import Message
 
 if typing.TYPE_CHECKING:
@@ -90,11 +91,11 @@ class SendGift:
             params["protect_content"] = protect_content
         
         # Make the API request to send the gift
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendGift"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
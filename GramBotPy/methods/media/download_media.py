@@ -2,12 +2,20 @@ import os
 import typing
 import aiohttp
 import asyncio
+import time
 from typing import Union, Optional, BinaryIO, Any, Dict
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
     from ...types import Message
 
+# Minimum number of seconds between two progress callback calls
+PROGRESS_INTERVAL = 0.5
+
+# Size of the chunks read from the response while streaming a download
+CHUNK_SIZE = 64 * 1024
+
 class DownloadMedia:
     """Method for downloading media from messages."""
     
@@ -40,6 +48,7 @@ class DownloadMedia:
             progress (``callable``, optional):
                 A callback function to report download progress.
                 Takes four arguments: (current, total, file_name, progress_args).
+                Called at most every half second, and once more when the download completes.
                 
             progress_args (``tuple``, optional):
                 Extra arguments to pass to the progress callback.
@@ -105,7 +114,7 @@ class DownloadMedia:
         media_type = None
         
         # Handle various message types
-        if hasattr(message, "photo") and message.photo:
+        if getattr(message, "photo", None):
             # Photos come as an array of PhotoSize, get the largest one
             media_type = "photo"
             if isinstance(message.photo, list) and len(message.photo) > 0:
@@ -115,37 +124,37 @@ class DownloadMedia:
                 file_size = photo.get("file_size", 0)
                 file_unique_id = photo.get("file_unique_id")
                 
-        elif hasattr(message, "video") and message.video:
+        elif getattr(message, "video", None):
             media_type = "video"
             file_id = message.video.get("file_id")
             file_size = message.video.get("file_size", 0)
             file_unique_id = message.video.get("file_unique_id")
             
-        elif hasattr(message, "audio") and message.audio:
+        elif getattr(message, "audio", None):
             media_type = "audio"
             file_id = message.audio.get("file_id")
             file_size = message.audio.get("file_size", 0)
             file_unique_id = message.audio.get("file_unique_id")
             
-        elif hasattr(message, "document") and message.document:
+        elif getattr(message, "document", None):
             media_type = "document"
             file_id = message.document.get("file_id")
             file_size = message.document.get("file_size", 0)
             file_unique_id = message.document.get("file_unique_id")
             
-        elif hasattr(message, "voice") and message.voice:
+        elif getattr(message, "voice", None):
             media_type = "voice"
             file_id = message.voice.get("file_id")
             file_size = message.voice.get("file_size", 0)
             file_unique_id = message.voice.get("file_unique_id")
             
-        elif hasattr(message, "sticker") and message.sticker:
+        elif getattr(message, "sticker", None):
             media_type = "sticker"
             file_id = message.sticker.get("file_id")
             file_size = message.sticker.get("file_size", 0)
             file_unique_id = message.sticker.get("file_unique_id")
             
-        elif hasattr(message, "animation") and message.animation:
+        elif getattr(message, "animation", None):
             media_type = "animation"
             file_id = message.animation.get("file_id")
             file_size = message.animation.get("file_size", 0)
@@ -203,13 +212,13 @@ class DownloadMedia:
             url = f"https://api.telegram.org/bot{self.token}/getFile"
             params = {"file_id": file_id}
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 async with session.get(url, params=params) as response:
                     if response.status != 200:
                         self.logger.error(f"HTTP error {response.status} when getting file path: {await response.text()}")
                         return None
                         
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error = result.get("description", "Unknown error")
@@ -287,7 +296,7 @@ class DownloadMedia:
         self.logger.info(f"Downloading from URL: {url}")
         
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 async with session.get(url) as response:
                     if response.status != 200:
                         self.logger.error(f"HTTP error {response.status} when downloading file: {await response.text()}")
@@ -301,13 +310,20 @@ class DownloadMedia:
                         # Download to memory
                         if progress and callable(progress):
                             # Read with progress updates
-                            data = b""
-                            downloaded = 0
-                            async for chunk in response.content.iter_chunked(8192):
+                            data = bytearray()
+                            downloaded = reported = 0
+                            last_report = time.monotonic()
+                            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
                                 data += chunk
                                 downloaded += len(chunk)
+                                now = time.monotonic()
+                                if now - last_report >= PROGRESS_INTERVAL:
+                                    last_report = now
+                                    reported = downloaded
+                                    progress(downloaded, file_size, local_path, progress_args)
+                            if reported != downloaded:
                                 progress(downloaded, file_size, local_path, progress_args)
-                            return data
+                            return bytes(data)
                         else:
                             # Read all at once
                             return await response.read()
@@ -319,15 +335,23 @@ class DownloadMedia:
                         if progress and callable(progress):
                             # Write with progress updates
                             with open(local_path, "wb") as f:
-                                downloaded = 0
-                                async for chunk in response.content.iter_chunked(8192):
+                                downloaded = reported = 0
+                                last_report = time.monotonic()
+                                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
                                     f.write(chunk)
                                     downloaded += len(chunk)
+                                    now = time.monotonic()
+                                    if now - last_report >= PROGRESS_INTERVAL:
+                                        last_report = now
+                                        reported = downloaded
+                                        progress(downloaded, file_size, local_path, progress_args)
+                                if reported != downloaded:
                                     progress(downloaded, file_size, local_path, progress_args)
                         else:
-                            # Write all at once
+                            # Stream to the file, memory use stays bounded by the chunk size
                             with open(local_path, "wb") as f:
-                                f.write(await response.read())
+                                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                                    f.write(chunk)
                                 
                         return local_path
                         
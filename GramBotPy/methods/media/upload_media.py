@@ -4,6 +4,7 @@ import json
 import aiohttp
 import mimetypes
 from typing import Union, Optional, BinaryIO, Dict, Any
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -207,7 +208,7 @@ class UploadMedia:
             # Upload the file
             url = f"https://api.telegram.org/bot{self.token}/{method}"
             
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 # Prepare request with progress tracking if needed
                 if progress and callable(progress) and file_size > 0:
                     # Here we'd need to implement a custom request with progress tracking
@@ -221,7 +222,7 @@ class UploadMedia:
                             
                         # Report completion
                         progress(file_size, file_size, filename, progress_args)
-                        result = await response.json()
+                        result = loads(await response.read())
                 else:
                     # Regular request without progress tracking
                     async with session.post(url, data=form) as response:
@@ -229,7 +230,7 @@ class UploadMedia:
                             self.logger.error(f"HTTP error {response.status} when uploading file: {await response.text()}")
                             return self._get_mock_file_info(file_type, filename)
                             
-                        result = await response.json()
+                        result = loads(await response.read())
                 
                 # Extract file info from the response
                 if not result.get("ok", False):
@@ -247,7 +248,9 @@ class UploadMedia:
                     if message_id:
                         delete_url = f"https://api.telegram.org/bot{self.token}/deleteMessage"
                         params = {"chat_id": fake_chat_id, "message_id": message_id}
-                        await session.post(delete_url, data=params)
+                        # Release the response so its connection returns to the shared pool
+                        async with session.post(delete_url, data=params):
+                            pass
                 except Exception as e:
                     self.logger.warning(f"Error deleting temporary message: {e}")
                 
@@ -1,6 +1,7 @@
 import typing
 import aiohttp
 from typing import Union, List
+from ...utils.serialization import loads
 
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
@@ -81,7 +82,7 @@ class DeleteMessages:
         message_ids = params["message_ids"]
         
         # Try to use the deleteMessages API for batch deletion first
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/deleteMessages"
                 data = {
@@ -92,7 +93,7 @@ class DeleteMessages:
                 async with session.post(url, json=data) as response:
                     # If the API exists, process the result
                     if response.status == 200:
-                        result = await response.json()
+                        result = loads(await response.read())
                         if result.get("ok", False):
                             return True
                         else:
@@ -131,7 +132,7 @@ class DeleteMessages:
         }
         
         # Make the API request
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/deleteMessage"
                 
@@ -142,7 +143,7 @@ class DeleteMessages:
                         return False
                     
                     # Parse the response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
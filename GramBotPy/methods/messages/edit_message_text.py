@@ -1,5 +1,7 @@
 import typing
 import json
+
+from ...utils.serialization import dumps, loads
 import aiohttp
 from typing import Optional, Union, Dict, Any
 from datetime import datetime
@@ -110,10 +112,7 @@ class EditMessageText:
             params["disable_web_page_preview"] = json.dumps(disable_web_page_preview)
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                params["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                params["reply_markup"] = json.dumps(reply_markup)
+            params["reply_markup"] = dumps(reply_markup)
                 
         return params
     
@@ -129,7 +128,7 @@ class EditMessageText:
         Returns:
             :obj:`Message` | ``bool``: The edited message or True for inline messages.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/editMessageText"
                 
@@ -143,7 +142,7 @@ class EditMessageText:
                         return False
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                 
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -4,6 +4,8 @@ import aiohttp
 from typing import Union, List, Optional, Dict, Any
 from datetime import datetime
 
+from ...utils.serialization import loads
+
 if typing.TYPE_CHECKING:
     from ...client import GramBotPy
     from ...types import Message
@@ -115,7 +117,7 @@ class ForwardMessages:
         # Try the batch forward API
         from ...types import Message
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 url = f"https://api.telegram.org/bot{self.token}/forwardMessages"
                 async with session.post(url, data=params) as response:
                     # Check if the API exists and works
@@ -123,7 +125,7 @@ class ForwardMessages:
                         self.logger.debug("Batch forward API not available, falling back to individual forwards")
                         return None
                     
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         self.logger.debug(f"Batch forward failed: {result.get('description', 'Unknown error')}")
@@ -166,7 +168,7 @@ class ForwardMessages:
         
         # Make the API request
         from ...types import Message
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/forwardMessage"
                 
@@ -178,7 +180,7 @@ class ForwardMessages:
                         return self._get_fallback_message(chat_id, from_chat_id, message_id)
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
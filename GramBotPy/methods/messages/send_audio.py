@@ -1,5 +1,7 @@
 import typing
 import json
+
+from ...utils.serialization import dumps, loads
 import aiohttp
 import os
 from typing import Union, Optional, BinaryIO, List
@@ -182,10 +184,7 @@ class SendAudio:
             data["allow_sending_without_reply"] = json.dumps(allow_sending_without_reply)
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                data["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                data["reply_markup"] = json.dumps(reply_markup)
+            data["reply_markup"] = dumps(reply_markup)
             
         # Determine if we're uploading a file or using a file_id/URL
         is_file_upload = False
@@ -243,7 +242,7 @@ class SendAudio:
             :obj:`Message`: The sent message or a placeholder in case of error.
         """
         # Make the API request
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendAudio"
                 
@@ -255,7 +254,7 @@ class SendAudio:
                         return self._get_audio_fallback_message(chat_id)
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                 
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
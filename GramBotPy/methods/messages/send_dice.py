@@ -1,5 +1,7 @@
 import typing
 import json
+
+from ...utils.serialization import dumps, loads
 import aiohttp
 from typing import Union, Optional
 from datetime import datetime
@@ -105,10 +107,7 @@ class SendDice:
             params["allow_sending_without_reply"] = json.dumps(allow_sending_without_reply)
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                params["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                params["reply_markup"] = json.dumps(reply_markup)
+            params["reply_markup"] = dumps(reply_markup)
         
         # Make the API request
         return await self._send_dice_request(chat_id, params)
@@ -123,7 +122,7 @@ class SendDice:
         Returns:
             :obj:`Message`: The sent message or a placeholder in case of error.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendDice"
                 
@@ -135,7 +134,7 @@ class SendDice:
                         return self._get_dice_fallback_message(chat_id)
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                 
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
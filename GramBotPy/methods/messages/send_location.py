@@ -1,5 +1,7 @@
 import typing
 import json
+
+from ...utils.serialization import dumps, loads
 import aiohttp
 from typing import Union, Optional, Dict, Any
 from datetime import datetime
@@ -125,10 +127,7 @@ class SendLocation:
             params["allow_sending_without_reply"] = json.dumps(allow_sending_without_reply)
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                params["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                params["reply_markup"] = json.dumps(reply_markup)
+            params["reply_markup"] = dumps(reply_markup)
         
         # Make the API request
         return await self._send_location_request(chat_id, params)
@@ -143,7 +142,7 @@ class SendLocation:
         Returns:
             :obj:`Message`: The sent message or a placeholder in case of error.
         """
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendLocation"
                 
@@ -155,7 +154,7 @@ class SendLocation:
                         return self._get_location_fallback_message(chat_id, params["latitude"], params["longitude"])
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                 
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -5,6 +5,7 @@ from datetime import datetime
 import aiohttp
 import json
 
+from ...utils.serialization import dumps, loads
 from ...types import Message
 
 if typing.TYPE_CHECKING:
@@ -125,17 +126,14 @@ class SendMessage:
             params["allow_sending_without_reply"] = allow_sending_without_reply
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                params["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                params["reply_markup"] = json.dumps(reply_markup)
+            params["reply_markup"] = dumps(reply_markup)
         
         # Make the API request to send the message
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendMessage"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -1,6 +1,8 @@
 import asyncio
 import typing
 import json
+
+from ...utils.serialization import dumps, loads
 import aiohttp
 import os
 from typing import Union, Optional, BinaryIO, List
@@ -156,10 +158,7 @@ class SendPhoto:
             data["allow_sending_without_reply"] = json.dumps(allow_sending_without_reply)
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                data["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                data["reply_markup"] = json.dumps(reply_markup)
+            data["reply_markup"] = dumps(reply_markup)
                 
         if has_spoiler is not None:
             data["has_spoiler"] = json.dumps(has_spoiler)
@@ -202,7 +201,7 @@ class SendPhoto:
             :obj:`Message`: The sent message or a placeholder in case of error.
         """
         # Make the API request
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendPhoto"
                 
@@ -214,7 +213,7 @@ class SendPhoto:
                         return self._get_photo_fallback_message(chat_id, caption)
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                 
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
@@ -1,5 +1,7 @@
 import typing
 import json
+
+from ...utils.serialization import dumps, loads
 import aiohttp
 import os
 from typing import Union, Optional, BinaryIO
@@ -124,10 +126,7 @@ class SendSticker:
             data["allow_sending_without_reply"] = json.dumps(allow_sending_without_reply)
             
         if reply_markup:
-            if hasattr(reply_markup, "to_dict"):
-                data["reply_markup"] = json.dumps(reply_markup.to_dict())
-            else:
-                data["reply_markup"] = json.dumps(reply_markup)
+            data["reply_markup"] = dumps(reply_markup)
             
         # Determine if we're uploading a file or using a file_id/URL
         is_file_upload = False
@@ -171,7 +170,7 @@ class SendSticker:
             :obj:`Message`: The sent message or a placeholder in case of error.
         """
         # Make the API request
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/sendSticker"
                 
@@ -183,7 +182,7 @@ class SendSticker:
                         return self._get_fallback_message(chat_id)
                     
                     # Parse the JSON response
-                    result = await response.json()
+                    result = loads(await response.read())
                 
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
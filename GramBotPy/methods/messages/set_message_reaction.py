@@ -1,8 +1,8 @@
 import logging
 import typing
 import aiohttp
-import json
 
+from ...utils.serialization import dumps, loads
 from ...types import ReactionType
 
 if typing.TYPE_CHECKING:
@@ -79,17 +79,17 @@ class SetMessageReaction:
         
         # Add optional parameters if they are provided
         if reaction is not None:
-            params["reaction"] = json.dumps([r.to_dict() for r in reaction])
+            params["reaction"] = dumps(reaction)
             
         if is_big is not None:
             params["is_big"] = is_big
         
         # Make the API request to set the message reaction
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             try:
                 url = f"https://api.telegram.org/bot{self.token}/setMessageReaction"
                 async with session.post(url, data=params) as response:
-                    result = await response.json()
+                    result = loads(await response.read())
                     
                     if not result.get("ok", False):
                         error_description = result.get('description', 'Unknown error')
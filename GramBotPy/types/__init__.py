@@ -16,7 +16,7 @@ from .document import Document
 from .video import Video
 from .voice import Voice
 from .contact import Contact
-from .location import Location
+from .location import Location, LocationBatch
 from .venue import Venue
 from .message_entity import MessageEntity
 from .game import Game
@@ -66,6 +66,7 @@ __all__ = [
     "Voice",
     "Contact",
     "Location",
+    "LocationBatch",
     "Venue",
     "MessageEntity",
     "Game",
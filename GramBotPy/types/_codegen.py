@@ -0,0 +1,207 @@
+import dataclasses
+import sys
+import typing
+
+from .._compat import msgspec
+
+
+def _dump(value):
+    """Serialize a nested value with its ``to_dict`` method when it has one."""
+    to_dict = getattr(value, "to_dict", None)
+    return value if to_dict is None else to_dict()
+
+
+def _value(name: str, nested: typing.Container[str], lists: typing.Container[str]) -> str:
+    """Return the source expression serializing the attribute ``name``."""
+    if name in lists:
+        return f"[_dump(item) for item in self.{name} or ()]"
+    if name in nested:
+        return f"_dump(self.{name})"
+    return f"self.{name}"
+
+
+def build_to_dict(
+    cls,
+    required: typing.Sequence[str] = (),
+    optional: typing.Sequence[str] = (),
+    truthy: typing.Sequence[str] = (),
+    nested: typing.Sequence[str] = (),
+    lists: typing.Sequence[str] = ()
+):
+    """Generate a specialized ``to_dict`` method for ``cls``.
+
+    The method source is emitted once at import time, so every call runs
+    straight-line bytecode instead of iterating over the fields. Dict keys
+    are interned strings bound through closure cells, so every generated
+    dict shares the same key objects.
+
+    Parameters:
+        cls (``type``):
+            The class receiving the generated method.
+
+        required (``list``, optional):
+            Attributes that are always included.
+
+        optional (``list``, optional):
+            Attributes included only when they are not ``None``.
+
+        truthy (``list``, optional):
+            Subset of ``optional`` included only when they are truthy.
+
+        nested (``list``, optional):
+            Attributes holding an object serialized with its own ``to_dict``.
+            Objects without one are included as they are.
+
+        lists (``list``, optional):
+            Attributes holding a list of objects serialized like ``nested``.
+            A required list that is ``None`` is serialized as an empty list.
+
+    Returns:
+        ``type``: The same class, for use as a decorator.
+    """
+    names = (*required, *optional)
+    items = ", ".join(f"_k_{name}: {_value(name, nested, lists)}" for name in required)
+    lines = [
+        f"def make_to_dict({', '.join(f'_k_{name}' for name in names)}):",
+        "    def to_dict(self):"
+    ]
+    lines.append(f"        result = {{{items}}}")
+
+    for name in optional:
+        condition = f"self.{name}" if name in truthy else f"self.{name} is not None"
+        lines.append(f"        if {condition}:")
+        lines.append(f"            result[_k_{name}] = {_value(name, nested, lists)}")
+
+    lines.append("        return result")
+    lines.append("    return to_dict")
+
+    namespace = {"_dump": _dump}
+    exec("\n".join(lines), namespace)
+
+    to_dict = namespace["make_to_dict"](*map(sys.intern, names))
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__module__ = cls.__module__
+    to_dict.__doc__ = f"Convert the {cls.__name__} object to a dictionary."
+    cls.to_dict = to_dict
+    return cls
+
+
+def generate_to_dict(**spec):
+    """Class decorator form of :func:`build_to_dict`."""
+    def decorator(cls):
+        return build_to_dict(cls, **spec)
+    return decorator
+
+
+_STRUCTURE_FNS = {}
+
+
+def _unwrap(hint):
+    """Return ``(is_list, inner)`` for a field annotation, stripping ``Optional``."""
+    origin = getattr(hint, "__origin__", None)
+    args = getattr(hint, "__args__", None) or ()
+    if origin is typing.Union:
+        args = [arg for arg in args if arg is not type(None)]
+        if len(args) == 1:
+            return _unwrap(args[0])
+    if origin is list:
+        return True, args[0] if args else None
+    return False, hint
+
+
+def build_structure_fn(cls):
+    """Generate a function building a ``cls`` dataclass from an API dict.
+
+    Nested dataclasses and lists of dataclasses are built recursively with
+    :func:`structure`; other classes are built with their ``_from_dict``
+    classmethod. Integers in ``float`` fields are converted to ``float``, like
+    ``msgspec.convert`` does. Fields whose name starts with an underscore are
+    left to their defaults.
+
+    Parameters:
+        cls (``type``):
+            The dataclass to build.
+
+    Returns:
+        ``callable``: A function taking the API dict and returning the instance.
+    """
+    hints = typing.get_type_hints(cls)
+    namespace = {"cls": cls, "structure": structure}
+    lines = ["def structure_fn(data):", "    get = data.get"]
+    arguments = []
+
+    for field in dataclasses.fields(cls):
+        if not field.init or field.name.startswith("_"):
+            continue
+
+        name = field.name
+        if field.default_factory is not dataclasses.MISSING:
+            namespace[f"_f_{name}"] = field.default_factory
+            value = f"get({name!r}) if {name!r} in data else _f_{name}()"
+        elif field.default is not dataclasses.MISSING and field.default is not None:
+            namespace[f"_d_{name}"] = field.default
+            value = f"get({name!r}, _d_{name})"
+        else:
+            value = f"get({name!r})"
+
+        is_list, inner = _unwrap(hints.get(name))
+        if dataclasses.is_dataclass(inner):
+            build = f"structure({{}}, _t_{name})"
+        elif hasattr(inner, "_from_dict"):
+            build = f"_t_{name}._from_dict({{}})"
+        else:
+            build = None
+
+        if build is not None:
+            namespace[f"_t_{name}"] = inner
+            lines.append(f"    v_{name} = {value}")
+            if is_list:
+                value = f"[{build.format('item')} for item in v_{name}] if v_{name} is not None else None"
+            else:
+                value = f"{build.format(f'v_{name}')} if v_{name} is not None else None"
+        elif inner is float and not is_list:
+            lines.append(f"    v_{name} = {value}")
+            value = f"float(v_{name}) if v_{name}.__class__ is int else v_{name}"
+
+        arguments.append(f"        {name}={value}")
+
+    lines.append("    return cls(")
+    lines.append(",\n".join(arguments))
+    lines.append("    )")
+    exec("\n".join(lines), namespace)
+
+    structure_fn = namespace["structure_fn"]
+    structure_fn.__qualname__ = f"{cls.__qualname__}._structure"
+    return structure_fn
+
+
+def structure(data: dict, cls):
+    """Build a ``cls`` dataclass from an API dict with a cached generated function."""
+    try:
+        structure_fn = _STRUCTURE_FNS[cls]
+    except KeyError:
+        structure_fn = _STRUCTURE_FNS[cls] = build_structure_fn(cls)
+    return structure_fn(data)
+
+
+def convert(data: dict, cls):
+    """Build a ``cls`` dataclass from an API dict, with ``msgspec`` when it is installed.
+    
+    Dicts that ``msgspec`` rejects, such as ones missing a field, are built with
+    :func:`structure` instead, so the result does not depend on whether the optional
+    dependency is installed: missing fields are ``None`` either way.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.convert(data, type=cls, dec_hook=dec_hook)
+        except msgspec.ValidationError:
+            pass
+    return structure(data, cls)
+
+
+def dec_hook(cls: type, obj: typing.Any) -> typing.Any:
+    """``msgspec`` decoding hook building classes that define ``_from_dict``."""
+    from_dict = getattr(cls, "_from_dict", None)
+    if from_dict is None:
+        raise NotImplementedError(f"Objects of type {cls.__name__} are not supported")
+    return from_dict(obj)
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""Distance kernels for :obj:`LocationBatch`.
+
+:mod:`._location_numba` compiles the same code with numba when it is installed.
+"""
+
+import math
+
+EARTH_RADIUS = 6371008.8
+"""Mean Earth radius in meters used for distance computations."""
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Return the great-circle distance in meters between two points given in degrees."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    half_dphi = (phi2 - phi1) * 0.5
+    half_dlambda = math.radians(lon2 - lon1) * 0.5
+    a = math.sin(half_dphi) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(half_dlambda) ** 2
+    return 2.0 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+def haversine_batch(lat1, lon1, lat2, lon2, out) -> None:
+    """Compute great-circle distances between pairs of points.
+    
+    Parameters:
+        lat1, lon1, lat2, lon2 (``array``):
+            Coordinates in degrees of the first and second point of each pair.
+            
+        out (``array``):
+            Receives the distance in meters for each pair.
+    """
+    for i in range(len(lat1)):
+        out[i] = haversine(lat1[i], lon1[i], lat2[i], lon2[i])
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Numba-compiled versions of the :mod:`._location_kernels` kernels.
+
+Importing this module requires numba; :mod:`.location` falls back to the
+pure-Python kernels when it is not installed.
+"""
+
+from numba import njit, prange
+
+from ._location_kernels import haversine
+
+_haversine = njit(fastmath=True, cache=True)(haversine)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def haversine_batch(lat1, lon1, lat2, lon2, out):
+    """Write the great-circle distance in meters between each pair of points to ``out``."""
+    for i in prange(lat1.size):
+        out[i] = _haversine(lat1[i], lon1[i], lat2[i], lon2[i])
\ No newline at end of file
@@ -0,0 +1,289 @@
+import typing
+from typing import Any, Union
+
+if typing.TYPE_CHECKING:
+    from .message import Message
+
+
+class MessageActionsMixin:
+    """Bound methods acting on a :obj:`Message` through its client.
+    
+    Kept apart from the message fields, so :obj:`Message` only declares its data.
+    """
+    
+    __slots__ = ()
+    
+    async def reply(
+        self,
+        text: str,
+        parse_mode: str = None,
+        entities: list = None,
+        disable_web_page_preview: bool = None,
+        disable_notification: bool = None,
+        reply_markup: Any = None
+    ) -> 'Message':
+        """Reply to this message.
+        
+        Parameters:
+            text (``str``):
+                Text of the message to be sent.
+                
+            parse_mode (``str``, optional):
+                Mode for parsing entities in the message text.
+                
+            entities (``list``, optional):
+                List of special entities that appear in message text.
+                
+            disable_web_page_preview (``bool``, optional):
+                Disables link previews for links in this message.
+                
+            disable_notification (``bool``, optional):
+                Sends the message silently.
+                
+            reply_markup (``object``, optional):
+                Additional interface options.
+                
+        Returns:
+            :obj:`Message`: On success, the sent message is returned.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+        
+        return await self._client.send_message(
+            chat_id=self.chat_id,
+            text=text,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_web_page_preview=disable_web_page_preview,
+            disable_notification=disable_notification,
+            reply_to_message_id=self.message_id,
+            reply_markup=reply_markup
+        )
+    
+    async def edit_text(
+        self,
+        text: str,
+        parse_mode: str = None,
+        entities: list = None,
+        disable_web_page_preview: bool = None,
+        reply_markup: Any = None
+    ) -> 'Message':
+        """Edit this message's text.
+        
+        Parameters:
+            text (``str``):
+                New text of the message.
+                
+            parse_mode (``str``, optional):
+                Mode for parsing entities in the message text.
+                
+            entities (``list``, optional):
+                List of special entities that appear in message text.
+                
+            disable_web_page_preview (``bool``, optional):
+                Disables link previews for links in this message.
+                
+            reply_markup (``object``, optional):
+                Additional interface options.
+                
+        Returns:
+            :obj:`Message`: On success, the edited message is returned.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+        
+        return await self._client.edit_message_text(
+            chat_id=self.chat_id,
+            message_id=self.message_id,
+            text=text,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_web_page_preview=disable_web_page_preview,
+            reply_markup=reply_markup
+        )
+    
+    async def delete(self) -> bool:
+        """Delete this message.
+        
+        Returns:
+            ``bool``: True on success.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+        
+        return await self._client.delete_messages(
+            chat_id=self.chat_id,
+            message_ids=self.message_id
+        )
+        
+    async def forward_to(self, chat_id: Union[int, str]) -> 'Message':
+        """Forward this message to another chat.
+        
+        Parameters:
+            chat_id (``int`` | ``str``):
+                Unique identifier for the target chat or username.
+                
+        Returns:
+            :obj:`Message`: The forwarded message.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+            
+        return await self._client.forward_messages(
+            chat_id=chat_id,
+            from_chat_id=self.chat_id,
+            message_ids=self.message_id
+        )
+    
+    async def reply_photo(
+        self,
+        photo: Union[str, bytes],
+        caption: str = None,
+        parse_mode: str = None,
+        caption_entities: list = None,
+        disable_notification: bool = None,
+        reply_markup: Any = None
+    ) -> 'Message':
+        """Reply to this message with a photo.
+        
+        Parameters:
+            photo (``str`` | ``bytes``):
+                Photo to send. Pass a file_id as string to send a photo that exists on the 
+                Telegram servers, pass an HTTP URL as a string for Telegram to get a photo 
+                from the Internet, or pass bytes for uploading a new photo.
+                
+            caption (``str``, optional):
+                Photo caption, 0-1024 characters after entities parsing.
+                
+            parse_mode (``str``, optional):
+                Mode for parsing entities in the photo caption.
+                
+            caption_entities (``list``, optional):
+                List of special entities that appear in the caption.
+                
+            disable_notification (``bool``, optional):
+                Sends the message silently.
+                
+            reply_markup (``object``, optional):
+                Additional interface options.
+                
+        Returns:
+            :obj:`Message`: On success, the sent photo message is returned.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+        
+        return await self._client.send_photo(
+            chat_id=self.chat_id,
+            photo=photo,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            disable_notification=disable_notification,
+            reply_to_message_id=self.message_id,
+            reply_markup=reply_markup
+        )
+        
+    async def reply_contact(
+        self,
+        phone_number: str,
+        first_name: str,
+        last_name: str = None,
+        vcard: str = None,
+        disable_notification: bool = None,
+        reply_markup: Any = None
+    ) -> 'Message':
+        """Reply to this message with a contact.
+        
+        Parameters:
+            phone_number (``str``):
+                Contact's phone number.
+                
+            first_name (``str``):
+                Contact's first name.
+                
+            last_name (``str``, optional):
+                Contact's last name.
+                
+            vcard (``str``, optional):
+                Additional data about the contact in the form of a vCard, 0-2048 bytes.
+                
+            disable_notification (``bool``, optional):
+                Sends the message silently.
+                
+            reply_markup (``object``, optional):
+                Additional interface options.
+                
+        Returns:
+            :obj:`Message`: On success, the sent contact message is returned.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+        
+        return await self._client.send_contact(
+            chat_id=self.chat_id,
+            phone_number=phone_number,
+            first_name=first_name,
+            last_name=last_name,
+            vcard=vcard,
+            disable_notification=disable_notification,
+            reply_to_message_id=self.message_id,
+            reply_markup=reply_markup
+        )
+        
+    async def reply_location(
+        self,
+        latitude: float,
+        longitude: float,
+        horizontal_accuracy: float = None,
+        live_period: int = None,
+        heading: int = None,
+        proximity_alert_radius: int = None,
+        disable_notification: bool = None,
+        reply_markup: Any = None
+    ) -> 'Message':
+        """Reply to this message with a location.
+        
+        Parameters:
+            latitude (``float``):
+                Latitude of the location.
+                
+            longitude (``float``):
+                Longitude of the location.
+                
+            horizontal_accuracy (``float``, optional):
+                The radius of uncertainty for the location, measured in meters (0-1500).
+                
+            live_period (``int``, optional):
+                Period in seconds for which the location will be updated, should be 60-86400.
+                
+            heading (``int``, optional):
+                For live locations, a direction in which the user is moving, in degrees (1-360).
+                
+            proximity_alert_radius (``int``, optional):
+                For live locations, maximum distance for proximity alerts, in meters (1-100000).
+                
+            disable_notification (``bool``, optional):
+                Sends the message silently.
+                
+            reply_markup (``object``, optional):
+                Additional interface options.
+                
+        Returns:
+            :obj:`Message`: On success, the sent location message is returned.
+        """
+        if not self._client:
+            raise ValueError("Message is not associated with a client")
+        
+        return await self._client.send_location(
+            chat_id=self.chat_id,
+            latitude=latitude,
+            longitude=longitude,
+            horizontal_accuracy=horizontal_accuracy,
+            live_period=live_period,
+            heading=heading,
+            proximity_alert_radius=proximity_alert_radius,
+            disable_notification=disable_notification,
+            reply_to_message_id=self.message_id,
+            reply_markup=reply_markup
+        ) 
\ No newline at end of file
@@ -1,10 +1,17 @@
 import json
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .photo_size import PhotoSize
 from .message_entity import MessageEntity
 from .animation import Animation
+from ._codegen import convert, generate_to_dict
 
+@generate_to_dict(
+    required=("title", "description", "photo"),
+    optional=("text", "text_entities", "animation"),
+    nested=("animation",),
+    lists=("photo", "text_entities")
+)
 @dataclass
 class Game:
     """This object represents a game.
@@ -37,7 +44,7 @@ class Game:
     
     title: str
     description: str
-    photo: typing.List[PhotoSize]
+    photo: typing.List[PhotoSize] = field(default_factory=list)
     text: str = None
     text_entities: typing.List[MessageEntity] = None
     animation: Animation = None
@@ -48,34 +55,4 @@ class Game:
         if not game_data:
             return None
             
-        photo = [PhotoSize._parse(client, photo_size) for photo_size in game_data.get("photo", [])]
-        text_entities = [MessageEntity._parse(client, entity) for entity in game_data.get("text_entities", [])]
-        animation = Animation._parse(client, game_data.get("animation"))
-        
-        return cls(
-            title=game_data.get("title"),
-            description=game_data.get("description"),
-            photo=photo,
-            text=game_data.get("text"),
-            text_entities=text_entities,
-            animation=animation
-        )
-        
-    def to_dict(self):
-        """Convert the Game object to a dictionary."""
-        result = {
-            "title": self.title,
-            "description": self.description,
-            "photo": [photo.to_dict() for photo in self.photo]
-        }
-        
-        if self.text is not None:
-            result["text"] = self.text
-            
-        if self.text_entities is not None:
-            result["text_entities"] = [entity.to_dict() for entity in self.text_entities]
-            
-        if self.animation is not None:
-            result["animation"] = self.animation.to_dict()
-            
-        return result 
\ No newline at end of file
+        return convert(game_data, cls)
\ No newline at end of file
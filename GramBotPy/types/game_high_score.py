@@ -1,8 +1,10 @@
 import typing
 from dataclasses import dataclass
 from .user import User
+from ._codegen import convert
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS, frozen=True)
 class GameHighScore:
     """This object represents one row of the high scores table for a game.
     
@@ -27,13 +29,7 @@ class GameHighScore:
         if not high_score_data:
             return None
             
-        user = User._parse(client, high_score_data.get("user"))
-        
-        return cls(
-            position=high_score_data.get("position"),
-            user=user,
-            score=high_score_data.get("score")
-        )
+        return convert(high_score_data, cls)
         
     def to_dict(self):
         """Convert the GameHighScore object to a dictionary."""
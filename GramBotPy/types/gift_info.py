@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+from ._codegen import convert, generate_to_dict
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@generate_to_dict(
+    required=("telegram_payment_charge_id", "provider_payment_charge_id", "gift_star_count"),
+    optional=("upgrade_star_count",)
+)
+@dataclass(**DATACLASS_SLOTS, frozen=True)
 class GiftInfo:
     """This object represents information about a gift.
     
@@ -29,22 +35,4 @@ class GiftInfo:
         if not gift_data:
             return None
             
-        return cls(
-            telegram_payment_charge_id=gift_data.get("telegram_payment_charge_id"),
-            provider_payment_charge_id=gift_data.get("provider_payment_charge_id"),
-            gift_star_count=gift_data.get("gift_star_count"),
-            upgrade_star_count=gift_data.get("upgrade_star_count")
-        )
-        
-    def to_dict(self):
-        """Convert the GiftInfo object to a dictionary."""
-        result = {
-            "telegram_payment_charge_id": self.telegram_payment_charge_id,
-            "provider_payment_charge_id": self.provider_payment_charge_id,
-            "gift_star_count": self.gift_star_count
-        }
-        
-        if self.upgrade_star_count is not None:
-            result["upgrade_star_count"] = self.upgrade_star_count
-            
-        return result 
\ No newline at end of file
+        return convert(gift_data, cls)
\ No newline at end of file
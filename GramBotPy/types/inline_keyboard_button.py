@@ -1,7 +1,28 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union, Dict, Any
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+# Optional fields of a button, indexed by the button kind; exactly one of them is set
+_KIND_KEYS = (
+    "url", "callback_data", "web_app", "login_url", "switch_inline_query",
+    "switch_inline_query_current_chat", "callback_game", "pay"
+)
+KIND_URL, KIND_CALLBACK_DATA, KIND_WEB_APP, KIND_LOGIN_URL, KIND_SWITCH_INLINE_QUERY, \
+    KIND_SWITCH_INLINE_QUERY_CURRENT_CHAT, KIND_CALLBACK_GAME, KIND_PAY = range(len(_KIND_KEYS))
+# Kinds whose value is a dict, left out of the hash
+_UNHASHABLE_KINDS = frozenset((KIND_WEB_APP, KIND_LOGIN_URL, KIND_CALLBACK_GAME))
+# Kinds counted as set even when their value is falsy (an empty query is valid)
+_NOT_NONE_KINDS = frozenset((KIND_SWITCH_INLINE_QUERY, KIND_SWITCH_INLINE_QUERY_CURRENT_CHAT))
+
+
+def _kind_property(kind: int, name: str) -> property:
+    """Return a read-only accessor for the optional field ``name``."""
+    def getter(self):
+        return self._value if self._kind == kind else None
+    getter.__name__ = name
+    return property(getter, doc=f"The ``{name}`` of the button, or ``None`` for other kinds.")
+
+@dataclass(**DATACLASS_SLOTS, frozen=True, init=False)
 class InlineKeyboardButton:
     """This object represents one button of an inline keyboard.
     
@@ -32,55 +53,103 @@ class InlineKeyboardButton:
             
         pay (``bool``, optional):
             Specify True to send a Pay button.
+            
+    Buttons are immutable and hashable, so they can be built once, reused and used as
+    dict keys. Only the text, the kind of the button and its single payload are stored,
+    in the ``text``, ``_kind`` and ``_value`` dataclass fields; the optional fields
+    above are read-only properties.
     """
     
     text: str
-    url: Optional[str] = None
-    callback_data: Optional[str] = None
-    web_app: Optional[Dict[str, Any]] = None
-    login_url: Optional[Dict[str, Any]] = None
-    switch_inline_query: Optional[str] = None
-    switch_inline_query_current_chat: Optional[str] = None
-    callback_game: Optional[Dict[str, Any]] = None
-    pay: Optional[bool] = None
+    _kind: int = field(repr=False)
+    _value: Any = field(repr=False)
     
-    def __post_init__(self):
-        # Validate that at least one of the optional parameters is set
-        if not any([
-            self.url, 
-            self.callback_data, 
-            self.web_app, 
-            self.login_url, 
-            self.switch_inline_query is not None, 
-            self.switch_inline_query_current_chat is not None, 
-            self.callback_game, 
-            self.pay
-        ]):
+    def __init__(
+        self,
+        text: str,
+        url: Optional[str] = None,
+        callback_data: Optional[str] = None,
+        web_app: Optional[Dict[str, Any]] = None,
+        login_url: Optional[Dict[str, Any]] = None,
+        switch_inline_query: Optional[str] = None,
+        switch_inline_query_current_chat: Optional[str] = None,
+        callback_game: Optional[Dict[str, Any]] = None,
+        pay: Optional[bool] = None,
+        _kind: Optional[int] = None,
+        _value: Any = None
+    ):
+        # _kind and _value are passed by dataclasses.replace(); an optional field
+        # passed along with them replaces the stored payload
+        kind = None
+        value = None
+        for index, candidate in enumerate((
+            url, callback_data, web_app, login_url, switch_inline_query,
+            switch_inline_query_current_chat, callback_game, pay
+        )):
+            if candidate is None if index in _NOT_NONE_KINDS else not candidate:
+                continue
+            if kind is not None:
+                kind = None
+                break
+            kind = index
+            value = candidate
+        else:
+            if kind is None and _kind is not None:
+                kind = _kind
+                value = _value
+        
+        if kind is None:
             raise ValueError(
                 "One and only one of url, callback_data, web_app, login_url, "
                 "switch_inline_query, switch_inline_query_current_chat, "
                 "callback_game, or pay must be specified"
             )
+        
+        setattr = object.__setattr__
+        setattr(self, "text", text)
+        setattr(self, "_kind", kind)
+        setattr(self, "_value", value)
+    
+    def __reduce__(self):
+        return type(self), (self.text,) + tuple(getattr(self, name) for name in _KIND_KEYS)
+    
+    def __hash__(self) -> int:
+        if self._kind in _UNHASHABLE_KINDS:
+            return hash((self.text, self._kind))
+        return hash((self.text, self._kind, self._value))
+    
+    def __repr__(self) -> str:
+        return f"InlineKeyboardButton(text={self.text!r}, {_KIND_KEYS[self._kind]}={self._value!r})"
+    
+    @property
+    def kind(self) -> int:
+        """The kind of the button, one of the ``KIND_*`` constants of this module."""
+        return self._kind
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the object to a dict suitable for JSON serialization."""
-        result = {"text": self.text}
+        """Convert the InlineKeyboardButton object to a dictionary."""
+        return {"text": self.text, _KIND_KEYS[self._kind]: self._value}
+    
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> "InlineKeyboardButton":
+        """Create a button from a dict with the Bot API field names.
         
-        if self.url:
-            result["url"] = self.url
-        if self.callback_data:
-            result["callback_data"] = self.callback_data
-        if self.web_app:
-            result["web_app"] = self.web_app
-        if self.login_url:
-            result["login_url"] = self.login_url
-        if self.switch_inline_query is not None:
-            result["switch_inline_query"] = self.switch_inline_query
-        if self.switch_inline_query_current_chat is not None:
-            result["switch_inline_query_current_chat"] = self.switch_inline_query_current_chat
-        if self.callback_game:
-            result["callback_game"] = self.callback_game
-        if self.pay:
-            result["pay"] = self.pay
-            
-        return result 
\ No newline at end of file
+        Fields are passed positionally, avoiding the keyword-argument binding of ``cls(**data)``.
+        """
+        get = data.get
+        return cls(
+            data["text"],
+            get("url"),
+            get("callback_data"),
+            get("web_app"),
+            get("login_url"),
+            get("switch_inline_query"),
+            get("switch_inline_query_current_chat"),
+            get("callback_game"),
+            get("pay")
+        )
+
+
+for _kind, _name in enumerate(_KIND_KEYS):
+    setattr(InlineKeyboardButton, _name, _kind_property(_kind, _name))
+del _kind, _name
\ No newline at end of file
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union
 from .inline_keyboard_button import InlineKeyboardButton
+from ..utils.serialization import dumps
 
 @dataclass
 class InlineKeyboardMarkup:
@@ -18,7 +19,7 @@ class InlineKeyboardMarkup:
         for i, row in enumerate(self.inline_keyboard):
             for j, button in enumerate(row):
                 if isinstance(button, dict):
-                    self.inline_keyboard[i][j] = InlineKeyboardButton(**button)
+                    self.inline_keyboard[i][j] = InlineKeyboardButton._from_dict(button)
     
     @classmethod
     def from_button(cls, button: Union[InlineKeyboardButton, Dict[str, Any]]) -> "InlineKeyboardMarkup":
@@ -32,8 +33,11 @@ class InlineKeyboardMarkup:
             :obj:`InlineKeyboardMarkup`: The inline keyboard.
         """
         if isinstance(button, dict):
-            button = InlineKeyboardButton(**button)
-        return cls(inline_keyboard=[[button]])
+            button = InlineKeyboardButton._from_dict(button)
+        # The button is already normalized, skip the __post_init__ walk
+        markup = cls.__new__(cls)
+        markup.inline_keyboard = [[button]]
+        return markup
     
     @classmethod
     def from_row(cls, row: List[Union[InlineKeyboardButton, Dict[str, Any]]]) -> "InlineKeyboardMarkup":
@@ -46,7 +50,12 @@ class InlineKeyboardMarkup:
         Returns:
             :obj:`InlineKeyboardMarkup`: The inline keyboard.
         """
-        return cls(inline_keyboard=[row])
+        markup = cls.__new__(cls)
+        markup.inline_keyboard = [[
+            InlineKeyboardButton._from_dict(button) if isinstance(button, dict) else button
+            for button in row
+        ]]
+        return markup
     
     def row(self, *buttons: Union[InlineKeyboardButton, Dict[str, Any]]) -> "InlineKeyboardMarkup":
         """Add a row of buttons to the keyboard.
@@ -61,7 +70,7 @@ class InlineKeyboardMarkup:
         button_row = []
         for button in buttons:
             if isinstance(button, dict):
-                button = InlineKeyboardButton(**button)
+                button = InlineKeyboardButton._from_dict(button)
             button_row.append(button)
         self.inline_keyboard.append(button_row)
         return self
@@ -78,7 +87,7 @@ class InlineKeyboardMarkup:
         """
         for button in buttons:
             if isinstance(button, dict):
-                button = InlineKeyboardButton(**button)
+                button = InlineKeyboardButton._from_dict(button)
             self.inline_keyboard.append([button])
         return self
     
@@ -89,4 +98,8 @@ class InlineKeyboardMarkup:
                 [button.to_dict() for button in row]
                 for row in self.inline_keyboard
             ]
-        } 
\ No newline at end of file
+        }
+    
+    def to_json(self) -> str:
+        """Serialize the object to the JSON string sent as the ``reply_markup`` parameter."""
+        return dumps(self.to_dict()) 
\ No newline at end of file
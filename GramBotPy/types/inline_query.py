@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from typing import Optional, List
 from .user import User
 from .location import Location
+from .._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS, repr=False)
 class InlineQuery:
     """
     This object represents an incoming inline query.
@@ -26,4 +27,7 @@ class InlineQuery:
     """Optional. Type of the chat, from which the inline query was sent."""
     
     location: Optional[Location] = None
-    """Optional. Sender location, only for bots that request user location""" 
\ No newline at end of file
+    """Optional. Sender location, only for bots that request user location"""
+    
+    def __repr__(self) -> str:
+        return f"InlineQuery(id={self.id!r}, query={self.query!r})" 
\ No newline at end of file
@@ -1,7 +1,13 @@
 import typing
 from dataclasses import dataclass
+from ._codegen import convert, generate_to_dict
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@generate_to_dict(
+    optional=("photo_id", "video_id", "thumbnail_position"),
+    truthy=("photo_id", "video_id")
+)
+@dataclass(**DATACLASS_SLOTS)
 class InputProfilePhoto:
     """This object describes a profile photo to be set.
     
@@ -29,23 +35,4 @@ class InputProfilePhoto:
         if not photo_data:
             return None
             
-        return cls(
-            photo_id=photo_data.get("photo_id"),
-            video_id=photo_data.get("video_id"),
-            thumbnail_position=photo_data.get("thumbnail_position")
-        )
-        
-    def to_dict(self):
-        """Convert the InputProfilePhoto object to a dictionary."""
-        result = {}
-        
-        if self.photo_id:
-            result["photo_id"] = self.photo_id
-            
-        if self.video_id:
-            result["video_id"] = self.video_id
-            
-        if self.thumbnail_position is not None:
-            result["thumbnail_position"] = self.thumbnail_position
-            
-        return result 
\ No newline at end of file
+        return convert(photo_data, cls)
\ No newline at end of file
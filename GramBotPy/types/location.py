@@ -1,7 +1,11 @@
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Iterable, List, Dict, Any
+from ._codegen import convert
+from ._location_kernels import EARTH_RADIUS, haversine_batch
+from .._compat import DATACLASS_SLOTS, numpy
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS, frozen=True)
 class Location:
     """This object represents a point on the map.
     
@@ -30,4 +34,178 @@ class Location:
     horizontal_accuracy: Optional[float] = None
     live_period: Optional[int] = None
     heading: Optional[int] = None
-    proximity_alert_radius: Optional[int] = None 
\ No newline at end of file
+    proximity_alert_radius: Optional[int] = None
+    
+    @classmethod
+    def _parse(cls, client, location_data: dict):
+        """Parse a Location object from the Telegram API response."""
+        if not location_data:
+            return None
+            
+        return convert(location_data, cls)
+
+
+_compiled_haversine_batch = None
+
+
+def _get_haversine_batch():
+    """Return the numba-compiled kernel if numba is installed, else ``None``."""
+    global _compiled_haversine_batch
+    if _compiled_haversine_batch is None:
+        try:
+            from ._location_numba import haversine_batch as compiled
+        except ImportError:
+            compiled = False
+        _compiled_haversine_batch = compiled
+    return _compiled_haversine_batch or None
+
+
+# Bits of LocationBatch.present_mask, one per optional Location field
+_HORIZONTAL_ACCURACY = 1
+_LIVE_PERIOD = 2
+_HEADING = 4
+_PROXIMITY_ALERT_RADIUS = 8
+
+
+class LocationBatch:
+    """Compact column storage for many :obj:`Location` objects.
+    
+    Useful for live location streams and analytics where thousands of points are kept
+    around: every field lives in a contiguous :mod:`array` instead of one Python object
+    per location, and a bitmask records which optional fields are present.
+    
+    Parameters:
+        locations (``list``, optional):
+            Locations to add to the batch.
+    """
+    
+    __slots__ = (
+        "longitude",
+        "latitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+        "present_mask"
+    )
+    
+    def __init__(self, locations: Iterable[Location] = ()):
+        self.longitude = array("d")
+        self.latitude = array("d")
+        self.horizontal_accuracy = array("d")
+        self.live_period = array("i")
+        self.heading = array("i")
+        self.proximity_alert_radius = array("i")
+        self.present_mask = array("B")
+        
+        for location in locations:
+            self.append(location)
+    
+    def __len__(self) -> int:
+        return len(self.present_mask)
+    
+    def __getitem__(self, index: int) -> Location:
+        mask = self.present_mask[index]
+        return Location(
+            longitude=self.longitude[index],
+            latitude=self.latitude[index],
+            horizontal_accuracy=self.horizontal_accuracy[index] if mask & _HORIZONTAL_ACCURACY else None,
+            live_period=self.live_period[index] if mask & _LIVE_PERIOD else None,
+            heading=self.heading[index] if mask & _HEADING else None,
+            proximity_alert_radius=self.proximity_alert_radius[index] if mask & _PROXIMITY_ALERT_RADIUS else None
+        )
+    
+    def append(self, location: Location) -> None:
+        """Add a location to the end of the batch.
+        
+        Parameters:
+            location (:obj:`Location`):
+                The location to add.
+        """
+        mask = 0
+        if location.horizontal_accuracy is not None:
+            mask |= _HORIZONTAL_ACCURACY
+        if location.live_period is not None:
+            mask |= _LIVE_PERIOD
+        if location.heading is not None:
+            mask |= _HEADING
+        if location.proximity_alert_radius is not None:
+            mask |= _PROXIMITY_ALERT_RADIUS
+        
+        self.longitude.append(location.longitude)
+        self.latitude.append(location.latitude)
+        self.horizontal_accuracy.append(location.horizontal_accuracy or 0.0)
+        self.live_period.append(location.live_period or 0)
+        self.heading.append(location.heading or 0)
+        self.proximity_alert_radius.append(location.proximity_alert_radius or 0)
+        self.present_mask.append(mask)
+    
+    def validate(self) -> None:
+        """Check that every present heading is within 1-360 degrees.
+        
+        Uses a single vectorized comparison when NumPy is installed.
+        
+        Raises:
+            ValueError: If a heading is out of range.
+        """
+        if numpy is not None:
+            heading = numpy.frombuffer(self.heading, dtype=numpy.int32)
+            present = numpy.frombuffer(self.present_mask, dtype=numpy.uint8) & _HEADING
+            invalid = numpy.logical_and(present, numpy.logical_or(heading < 1, heading > 360))
+            if invalid.any():
+                index = int(numpy.argmax(invalid))
+                raise ValueError(f"Invalid heading {self.heading[index]} at index {index}, must be 1-360")
+            return
+        
+        for index, (heading, mask) in enumerate(zip(self.heading, self.present_mask)):
+            if mask & _HEADING and not 1 <= heading <= 360:
+                raise ValueError(f"Invalid heading {heading} at index {index}, must be 1-360")
+    
+    def distances_to(self, location: Location) -> array:
+        """Compute the distance from every location in the batch to ``location``.
+        
+        The numba-compiled kernel is used when numba is installed.
+        
+        Parameters:
+            location (:obj:`Location`):
+                The reference point.
+                
+        Returns:
+            ``array``: Distances in meters, in batch order.
+        """
+        count = len(self)
+        out = array("d", bytes(8 * count))
+        lat2 = array("d", [location.latitude]) * count
+        lon2 = array("d", [location.longitude]) * count
+        
+        compiled = _get_haversine_batch()
+        if compiled is not None and numpy is not None:
+            compiled(
+                numpy.frombuffer(self.latitude, dtype=numpy.float64),
+                numpy.frombuffer(self.longitude, dtype=numpy.float64),
+                numpy.frombuffer(lat2, dtype=numpy.float64),
+                numpy.frombuffer(lon2, dtype=numpy.float64),
+                numpy.frombuffer(out, dtype=numpy.float64)
+            )
+        else:
+            haversine_batch(self.latitude, self.longitude, lat2, lon2, out)
+        return out
+    
+    def to_list_of_dicts(self) -> List[Dict[str, Any]]:
+        """Convert the batch to a list of dicts suitable for JSON serialization."""
+        result = []
+        for index, mask in enumerate(self.present_mask):
+            item = {
+                "longitude": self.longitude[index],
+                "latitude": self.latitude[index]
+            }
+            if mask & _HORIZONTAL_ACCURACY:
+                item["horizontal_accuracy"] = self.horizontal_accuracy[index]
+            if mask & _LIVE_PERIOD:
+                item["live_period"] = self.live_period[index]
+            if mask & _HEADING:
+                item["heading"] = self.heading[index]
+            if mask & _PROXIMITY_ALERT_RADIUS:
+                item["proximity_alert_radius"] = self.proximity_alert_radius[index]
+            result.append(item)
+        return result
\ No newline at end of file
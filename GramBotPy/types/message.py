@@ -1,11 +1,60 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Any, Type, TypeVar
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, Type, TypeVar
 from datetime import datetime
 
+from ._message_actions import MessageActionsMixin
+from .._compat import DATACLASS_SLOTS
+
 T = TypeVar('T', bound='Message')
 
-@dataclass
-class Message:
+# Released messages waiting to be reused by _parse
+_MESSAGE_POOL = deque(maxlen=1024)
+
+# Marks a lazily computed property that has not been computed yet
+_UNSET = object()
+
+# API keys of the optional message fields, with the matching attribute names
+_OPTIONAL_FIELDS = (
+    ('from', 'from_user'), ('text', 'text'), ('entities', 'entities'),
+    ('reply_markup', 'reply_markup'), ('caption', 'caption'), ('photo', 'photo'),
+    ('video', 'video'), ('audio', 'audio'), ('document', 'document'), ('sticker', 'sticker'),
+    ('new_chat_members', 'new_chat_members'), ('contact', 'contact'), ('location', 'location')
+)
+
+# Fill functions generated per message shape, keyed by the tuple of keys of the API dict
+_FILLERS = {}
+_MAX_FILLERS = 256
+
+
+def _build_filler(shape: tuple):
+    """Generate a function filling a blank message from an API dict with the given keys.
+    
+    Present keys are read without a membership test and absent fields are set to
+    ``None`` directly, so the function only touches the fields of that shape.
+    """
+    present = set(shape)
+    lines = [
+        "def fill(message, client, data, reply_to_message):",
+        "    message.message_id = " + ("data['message_id']" if 'message_id' in present else "-1"),
+        "    message.date = " + ("data['date']" if 'date' in present else "int(time())"),
+        "    message.chat = " + ("data['chat']" if 'chat' in present else "{'id': 0, 'type': 'private'}"),
+        "    message.reply_to_message = reply_to_message",
+        "    message._client = client",
+        "    message.command_args = None",
+        "    message._date_dt = message._content = message._media = _UNSET"
+    ]
+    for key, name in _OPTIONAL_FIELDS:
+        lines.append(f"    message.{name} = " + (f"data[{key!r}]" if key in present else "None"))
+    lines.append("    return message")
+    
+    namespace = {"time": time.time, "_UNSET": _UNSET}
+    exec("\n".join(lines), namespace)
+    return namespace["fill"]
+
+@dataclass(**DATACLASS_SLOTS)
+class Message(MessageActionsMixin):
     """This object represents a message.
     
     Parameters:
@@ -59,6 +108,15 @@ class Message:
         
         location (``dict``, optional):
             Location information for the message.
+        
+        command_args (``str``, optional):
+            For messages handled by a command handler, the text following the command.
+            Set by the dispatcher; empty when the command has no arguments.
+    
+    Messages must be treated as read-only once parsed: :attr:`chat_id`, :attr:`sender_id`,
+    :attr:`date_dt`, :attr:`content` and :attr:`media` are computed on first access and
+    cached, so they do not follow later changes to ``chat``, ``from_user``, ``date``,
+    ``text``, ``caption`` or the media fields.
     """
     
     message_id: int
@@ -78,12 +136,14 @@ class Message:
     new_chat_members: Optional[List[Dict[str, Any]]] = None
     contact: Optional[Dict[str, Any]] = None
     location: Optional[Dict[str, Any]] = None
+    command_args: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     _client: Any = field(default=None, repr=False)
-    
-    def __post_init__(self):
-        # Convert Unix timestamp to datetime if needed
-        if isinstance(self.date, int):
-            self._date_dt = datetime.fromtimestamp(self.date)
+    # Values of the lazily computed properties, filled on first access
+    _date_dt: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _content: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _media: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _chat_id: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _sender_id: Any = field(default=_UNSET, init=False, repr=False, compare=False)
     
     @classmethod
     def _parse(cls: Type[T], client: Any, data: Dict[str, Any]) -> T:
@@ -99,349 +159,158 @@ class Message:
         if not data:
             return cls(
                 message_id=-1,
-                date=int(datetime.now().timestamp()),
+                date=int(time.time()),
                 chat={"id": 0, "type": "private"},
                 _client=client
             )
         
-        # Handle reply_to_message recursively if it exists
-        reply_to_message = None
-        if data.get('reply_to_message'):
-            reply_to_message = cls._parse(client, data['reply_to_message'])
+        # Walk the reply chain iteratively and build it from the oldest message,
+        # so long reply threads do not grow the call stack
+        chain = []
+        while data:
+            chain.append(data)
+            data = data.get('reply_to_message')
         
-        # Create dictionary with required parameters
-        params = {
-            "message_id": data.get('message_id', -1),
-            "date": data.get('date', int(datetime.now().timestamp())),
-            "chat": data.get('chat', {"id": 0, "type": "private"}),
-            "_client": client
-        }
+        # Replied-to messages are snapshots, built without the pool
+        message = None
+        for data in reversed(chain[1:]):
+            message = cls._parse_readonly(client, data, message)
+        return cls._parse_one(client, chain[0], message)
+    
+    @classmethod
+    def _parse_one(cls: Type[T], client: Any, data: Dict[str, Any], reply_to_message: Optional['Message']) -> T:
+        """Parse a single message, linking the already parsed message it replies to."""
+        message = cls._fill_shape(cls._acquire(), client, data, reply_to_message)
+        # chat_id and sender_id are read by every reply, so they are resolved up front
+        message._chat_id = message.chat.get("id")
+        from_user = message.from_user
+        message._sender_id = from_user.get("id") if from_user else None
+        return message
+    
+    @classmethod
+    def _parse_readonly(cls: Type[T], client: Any, data: Dict[str, Any], reply_to_message: Optional['Message']) -> T:
+        """Parse a replied-to message.
         
-        # Add optional parameters if they exist
-        optional_fields = [
-            'from', 'text', 'entities', 'caption', 'photo', 
-            'video', 'audio', 'document', 'sticker', 'reply_markup', 
-            'new_chat_members', 'contact', 'location'
-        ]
+        These are rarely used for outgoing calls, so the message is a new instance rather
+        than a pooled one, and chat_id and sender_id are left to be computed on access.
+        """
+        message = cls._fill_shape(cls.__new__(cls), client, data, reply_to_message)
+        message._chat_id = message._sender_id = _UNSET
+        return message
+    
+    @staticmethod
+    def _fill_shape(message: T, client: Any, data: Dict[str, Any], reply_to_message: Optional['Message']) -> T:
+        """Fill a blank message with the function generated for the shape of ``data``.
         
-        for field in optional_fields:
-            if field in data:
-                # Map 'from' to 'from_user' in our class
-                if field == 'from':
-                    params['from_user'] = data['from']
-                else:
-                    params[field] = data[field]
+        Shapes beyond the first :data:`_MAX_FILLERS` use the generic :meth:`_fill`.
+        """
+        shape = tuple(data)
+        fill = _FILLERS.get(shape)
+        if fill is None:
+            if len(_FILLERS) >= _MAX_FILLERS:
+                return Message._fill(message, client, data, reply_to_message)
+            fill = _FILLERS[shape] = _build_filler(shape)
+        return fill(message, client, data, reply_to_message)
+    
+    @staticmethod
+    def _fill(message: T, client: Any, data: Dict[str, Any], reply_to_message: Optional['Message']) -> T:
+        """Assign the fields of a blank message directly instead of going through __init__."""
+        get = data.get
+        message.message_id = get('message_id', -1)
+        # Defaults are only built when the key is missing
+        message.date = data['date'] if 'date' in data else int(time.time())
+        message.chat = data['chat'] if 'chat' in data else {"id": 0, "type": "private"}
+        # Map 'from' to 'from_user' in our class
+        message.from_user = get('from')
+        message.text = get('text')
+        message.entities = get('entities')
+        message.reply_to_message = reply_to_message
+        message.reply_markup = get('reply_markup')
+        message.caption = get('caption')
+        message.photo = get('photo')
+        message.video = get('video')
+        message.audio = get('audio')
+        message.document = get('document')
+        message.sticker = get('sticker')
+        message.new_chat_members = get('new_chat_members')
+        message.contact = get('contact')
+        message.location = get('location')
+        message._client = client
+        message.command_args = None
+        message._date_dt = message._content = message._media = _UNSET
+        return message
+    
+    @classmethod
+    def _acquire(cls: Type[T]) -> T:
+        """Return a released message from the pool, or a new uninitialized instance."""
+        if cls is Message and _MESSAGE_POOL:
+            return _MESSAGE_POOL.pop()
+        return cls.__new__(cls)
+    
+    def _release(self) -> None:
+        """Clear this message and its replied messages and return them to the pool.
         
-        # Add reply_to_message if we parsed it
-        if reply_to_message:
-            params['reply_to_message'] = reply_to_message
-            
-        # Create a new Message instance
-        return cls(**params)
+        The message must not be used afterwards. Messages without a client are not
+        pooled, since they may be owned by user code.
+        """
+        message = self
+        while message is not None and message._client is not None:
+            reply_to_message = message.reply_to_message
+            for name in _FIELD_NAMES:
+                setattr(message, name, None)
+            if type(message) is Message:
+                _MESSAGE_POOL.append(message)
+            message = reply_to_message
     
     @property
     def id(self) -> int:
         """Alias for message_id."""
         return self.message_id
     
+    # The properties below are computed on first access and then cached,
+    # which is why messages are read-only (see the class docstring)
+    
     @property
     def chat_id(self) -> int:
         """Get the chat ID."""
-        return self.chat.get("id")
+        chat_id = self._chat_id
+        if chat_id is _UNSET:
+            chat_id = self._chat_id = self.chat.get("id")
+        return chat_id
     
     @property
     def sender_id(self) -> Optional[int]:
         """Get the sender ID."""
-        if self.from_user:
-            return self.from_user.get("id")
-        return None
+        sender_id = self._sender_id
+        if sender_id is _UNSET:
+            sender_id = self._sender_id = self.from_user.get("id") if self.from_user else None
+        return sender_id
     
     @property
     def date_dt(self) -> datetime:
         """Get the message date as a datetime object."""
-        return self._date_dt
+        date_dt = self._date_dt
+        if date_dt is _UNSET:
+            date_dt = self._date_dt = datetime.fromtimestamp(self.date)
+        return date_dt
     
     @property
     def content(self) -> Optional[str]:
         """Get the message content (text or caption)."""
-        return self.text or self.caption
+        content = self._content
+        if content is _UNSET:
+            content = self._content = self.text or self.caption
+        return content
     
     @property
     def media(self) -> bool:
         """Check if the message contains media."""
-        return any([self.photo, self.video, self.audio, self.document, self.sticker])
-    
-    async def reply(
-        self,
-        text: str,
-        parse_mode: str = None,
-        entities: list = None,
-        disable_web_page_preview: bool = None,
-        disable_notification: bool = None,
-        reply_markup: Any = None
-    ) -> 'Message':
-        """Reply to this message.
-        
-        Parameters:
-            text (``str``):
-                Text of the message to be sent.
-                
-            parse_mode (``str``, optional):
-                Mode for parsing entities in the message text.
-                
-            entities (``list``, optional):
-                List of special entities that appear in message text.
-                
-            disable_web_page_preview (``bool``, optional):
-                Disables link previews for links in this message.
-                
-            disable_notification (``bool``, optional):
-                Sends the message silently.
-                
-            reply_markup (``object``, optional):
-                Additional interface options.
-                
-        Returns:
-            :obj:`Message`: On success, the sent message is returned.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-        
-        return await self._client.send_message(
-            chat_id=self.chat_id,
-            text=text,
-            parse_mode=parse_mode,
-            entities=entities,
-            disable_web_page_preview=disable_web_page_preview,
-            disable_notification=disable_notification,
-            reply_to_message_id=self.message_id,
-            reply_markup=reply_markup
-        )
-    
-    async def edit_text(
-        self,
-        text: str,
-        parse_mode: str = None,
-        entities: list = None,
-        disable_web_page_preview: bool = None,
-        reply_markup: Any = None
-    ) -> 'Message':
-        """Edit this message's text.
-        
-        Parameters:
-            text (``str``):
-                New text of the message.
-                
-            parse_mode (``str``, optional):
-                Mode for parsing entities in the message text.
-                
-            entities (``list``, optional):
-                List of special entities that appear in message text.
-                
-            disable_web_page_preview (``bool``, optional):
-                Disables link previews for links in this message.
-                
-            reply_markup (``object``, optional):
-                Additional interface options.
-                
-        Returns:
-            :obj:`Message`: On success, the edited message is returned.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-        
-        return await self._client.edit_message_text(
-            chat_id=self.chat_id,
-            message_id=self.message_id,
-            text=text,
-            parse_mode=parse_mode,
-            entities=entities,
-            disable_web_page_preview=disable_web_page_preview,
-            reply_markup=reply_markup
-        )
-    
-    async def delete(self) -> bool:
-        """Delete this message.
-        
-        Returns:
-            ``bool``: True on success.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-        
-        return await self._client.delete_messages(
-            chat_id=self.chat_id,
-            message_ids=self.message_id
-        )
-        
-    async def forward_to(self, chat_id: Union[int, str]) -> 'Message':
-        """Forward this message to another chat.
-        
-        Parameters:
-            chat_id (``int`` | ``str``):
-                Unique identifier for the target chat or username.
-                
-        Returns:
-            :obj:`Message`: The forwarded message.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-            
-        return await self._client.forward_messages(
-            chat_id=chat_id,
-            from_chat_id=self.chat_id,
-            message_ids=self.message_id
-        )
-    
-    async def reply_photo(
-        self,
-        photo: Union[str, bytes],
-        caption: str = None,
-        parse_mode: str = None,
-        caption_entities: list = None,
-        disable_notification: bool = None,
-        reply_markup: Any = None
-    ) -> 'Message':
-        """Reply to this message with a photo.
-        
-        Parameters:
-            photo (``str`` | ``bytes``):
-                Photo to send. Pass a file_id as string to send a photo that exists on the 
-                Telegram servers, pass an HTTP URL as a string for Telegram to get a photo 
-                from the Internet, or pass bytes for uploading a new photo.
-                
-            caption (``str``, optional):
-                Photo caption, 0-1024 characters after entities parsing.
-                
-            parse_mode (``str``, optional):
-                Mode for parsing entities in the photo caption.
-                
-            caption_entities (``list``, optional):
-                List of special entities that appear in the caption.
-                
-            disable_notification (``bool``, optional):
-                Sends the message silently.
-                
-            reply_markup (``object``, optional):
-                Additional interface options.
-                
-        Returns:
-            :obj:`Message`: On success, the sent photo message is returned.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-        
-        return await self._client.send_photo(
-            chat_id=self.chat_id,
-            photo=photo,
-            caption=caption,
-            parse_mode=parse_mode,
-            caption_entities=caption_entities,
-            disable_notification=disable_notification,
-            reply_to_message_id=self.message_id,
-            reply_markup=reply_markup
-        )
-        
-    async def reply_contact(
-        self,
-        phone_number: str,
-        first_name: str,
-        last_name: str = None,
-        vcard: str = None,
-        disable_notification: bool = None,
-        reply_markup: Any = None
-    ) -> 'Message':
-        """Reply to this message with a contact.
-        
-        Parameters:
-            phone_number (``str``):
-                Contact's phone number.
-                
-            first_name (``str``):
-                Contact's first name.
-                
-            last_name (``str``, optional):
-                Contact's last name.
-                
-            vcard (``str``, optional):
-                Additional data about the contact in the form of a vCard, 0-2048 bytes.
-                
-            disable_notification (``bool``, optional):
-                Sends the message silently.
-                
-            reply_markup (``object``, optional):
-                Additional interface options.
-                
-        Returns:
-            :obj:`Message`: On success, the sent contact message is returned.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-        
-        return await self._client.send_contact(
-            chat_id=self.chat_id,
-            phone_number=phone_number,
-            first_name=first_name,
-            last_name=last_name,
-            vcard=vcard,
-            disable_notification=disable_notification,
-            reply_to_message_id=self.message_id,
-            reply_markup=reply_markup
-        )
-        
-    async def reply_location(
-        self,
-        latitude: float,
-        longitude: float,
-        horizontal_accuracy: float = None,
-        live_period: int = None,
-        heading: int = None,
-        proximity_alert_radius: int = None,
-        disable_notification: bool = None,
-        reply_markup: Any = None
-    ) -> 'Message':
-        """Reply to this message with a location.
-        
-        Parameters:
-            latitude (``float``):
-                Latitude of the location.
-                
-            longitude (``float``):
-                Longitude of the location.
-                
-            horizontal_accuracy (``float``, optional):
-                The radius of uncertainty for the location, measured in meters (0-1500).
-                
-            live_period (``int``, optional):
-                Period in seconds for which the location will be updated, should be 60-86400.
-                
-            heading (``int``, optional):
-                For live locations, a direction in which the user is moving, in degrees (1-360).
-                
-            proximity_alert_radius (``int``, optional):
-                For live locations, maximum distance for proximity alerts, in meters (1-100000).
-                
-            disable_notification (``bool``, optional):
-                Sends the message silently.
-                
-            reply_markup (``object``, optional):
-                Additional interface options.
-                
-        Returns:
-            :obj:`Message`: On success, the sent location message is returned.
-        """
-        if not self._client:
-            raise ValueError("Message is not associated with a client")
-        
-        return await self._client.send_location(
-            chat_id=self.chat_id,
-            latitude=latitude,
-            longitude=longitude,
-            horizontal_accuracy=horizontal_accuracy,
-            live_period=live_period,
-            heading=heading,
-            proximity_alert_radius=proximity_alert_radius,
-            disable_notification=disable_notification,
-            reply_to_message_id=self.message_id,
-            reply_markup=reply_markup
-        ) 
\ No newline at end of file
+        media = self._media
+        if media is _UNSET:
+            media = self._media = bool(
+                self.photo or self.video or self.audio or self.document or self.sticker
+            )
+        return media
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(Message))
\ No newline at end of file
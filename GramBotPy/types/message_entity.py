@@ -1,8 +1,23 @@
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from typing import Any, Dict, Optional
+from .user import User
+from ._codegen import generate_to_dict, structure
 
+# Entity types known to the Bot API; the position of a type is its type_id
+ENTITY_TYPES = (
+    "mention", "hashtag", "cashtag", "bot_command", "url", "email", "phone_number",
+    "bold", "italic", "underline", "strikethrough", "spoiler", "code", "pre",
+    "text_link", "text_mention", "custom_emoji"
+)
+_TYPE_INTERN = {name: sys.intern(name) for name in ENTITY_TYPES}
+_TYPE_IDS = {name: type_id for type_id, name in enumerate(ENTITY_TYPES)}
 
-@dataclass
+
+@generate_to_dict(
+    required=("type", "offset", "length"),
+    optional=("url", "user", "language", "custom_emoji_id"),
+    nested=("user",)
+)
 class MessageEntity:
     """
     This object represents one special entity in a text message.
@@ -48,24 +63,68 @@ class MessageEntity:
             For "custom_emoji" only, unique identifier of the custom emoji.
     """
     
-    type: str
-    """Type of the entity. Can be "mention", "hashtag", "cashtag", "bot_command", "url", "email", "phone_number",
-    "bold", "italic", "underline", "strikethrough", "spoiler", "code", "pre", "text_link", "text_mention", "custom_emoji"."""
-    
-    offset: int
-    """Offset in UTF-16 code units to the start of the entity"""
+    __slots__ = ("type", "offset", "length", "url", "user", "language", "custom_emoji_id")
     
-    length: int
-    """Length of the entity in UTF-16 code units"""
+    def __init__(
+        self,
+        type: str,
+        offset: int,
+        length: int,
+        url: Optional[str] = None,
+        user: Optional[User] = None,
+        language: Optional[str] = None,
+        custom_emoji_id: Optional[str] = None
+    ):
+        # Share one string object per entity type
+        self.type = _TYPE_INTERN.get(type) or sys.intern(type)
+        self.offset = offset
+        self.length = length
+        self.url = url
+        self.user = user
+        self.language = language
+        self.custom_emoji_id = custom_emoji_id
     
-    url: Optional[str] = None
-    """Optional. For "text_link" only, url that will be opened after user taps on the text"""
+    @property
+    def type_id(self) -> int:
+        """``int``: Index of the type in ``ENTITY_TYPES``, or -1 for types unknown to this version."""
+        return _TYPE_IDS.get(self.type, -1)
     
-    user: Optional['User'] = None
-    """Optional. For "text_mention" only, the mentioned user"""
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> "MessageEntity":
+        """Create an entity from a dict with the Bot API field names.
+        
+        Fields are passed positionally, avoiding the keyword-argument binding of ``cls(**data)``.
+        """
+        get = data.get
+        user = get("user")
+        if user is not None:
+            user = structure(user, User)
+        return cls(
+            data["type"],
+            data["offset"],
+            data["length"],
+            get("url"),
+            user,
+            get("language"),
+            get("custom_emoji_id")
+        )
     
-    language: Optional[str] = None
-    """Optional. For "pre" only, the programming language of the entity text"""
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.type == other.type
+            and self.offset == other.offset
+            and self.length == other.length
+            and self.url == other.url
+            and self.user == other.user
+            and self.language == other.language
+            and self.custom_emoji_id == other.custom_emoji_id
+        )
     
-    custom_emoji_id: Optional[str] = None
-    """Optional. For "custom_emoji" only, unique identifier of the custom emoji""" 
\ No newline at end of file
+    def __repr__(self) -> str:
+        return (
+            f"MessageEntity(type={self.type!r}, offset={self.offset!r}, length={self.length!r}, "
+            f"url={self.url!r}, user={self.user!r}, language={self.language!r}, "
+            f"custom_emoji_id={self.custom_emoji_id!r})"
+        )
\ No newline at end of file
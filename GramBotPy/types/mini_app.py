@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 import typing
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WebAppInfo:
     """Contains information about a Web App.
     
@@ -14,14 +15,14 @@ class WebAppInfo:
     url: str
     
     @classmethod
-    def _parse(cls, client, app_data: dict):
+    def _parse(cls, app_data: dict):
         """Parse a WebAppInfo object from the Telegram API response."""
         if not app_data:
             return None
             
-        return cls(
-            url=app_data.get("url")
-        )
+        obj = cls.__new__(cls)
+        obj.url = app_data.get("url")
+        return obj
     
     def to_dict(self):
         """Convert the WebAppInfo object to a dictionary."""
@@ -30,7 +31,7 @@ class WebAppInfo:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WebAppData:
     """Contains data sent from a Web App to the bot.
     
@@ -47,15 +48,15 @@ class WebAppData:
     button_text: str
     
     @classmethod
-    def _parse(cls, client, app_data: dict):
+    def _parse(cls, app_data: dict):
         """Parse a WebAppData object from the Telegram API response."""
         if not app_data:
             return None
             
-        return cls(
-            data=app_data.get("data"),
-            button_text=app_data.get("button_text")
-        )
+        obj = cls.__new__(cls)
+        obj.data = app_data.get("data")
+        obj.button_text = app_data.get("button_text")
+        return obj
     
     def to_dict(self):
         """Convert the WebAppData object to a dictionary."""
@@ -65,7 +66,7 @@ class WebAppData:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SentWebAppMessage:
     """Contains information about an inline message sent by a Web App on behalf of a user.
     
@@ -78,14 +79,14 @@ class SentWebAppMessage:
     inline_message_id: str = None
     
     @classmethod
-    def _parse(cls, client, message_data: dict):
+    def _parse(cls, message_data: dict):
         """Parse a SentWebAppMessage object from the Telegram API response."""
         if not message_data:
             return None
             
-        return cls(
-            inline_message_id=message_data.get("inline_message_id")
-        )
+        obj = cls.__new__(cls)
+        obj.inline_message_id = message_data.get("inline_message_id")
+        return obj
     
     def to_dict(self):
         """Convert the SentWebAppMessage object to a dictionary."""
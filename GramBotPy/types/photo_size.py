@@ -1,7 +1,13 @@
 from dataclasses import dataclass
 from typing import Optional
+from ._codegen import generate_to_dict
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@generate_to_dict(
+    required=("file_id", "file_unique_id", "width", "height"),
+    optional=("file_size",)
+)
+@dataclass(**DATACLASS_SLOTS)
 class PhotoSize:
     """This object represents one size of a photo or a file / sticker thumbnail.
     
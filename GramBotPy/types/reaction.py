@@ -1,5 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import typing
+from ._codegen import generate_to_dict
+from .._compat import DATACLASS_SLOTS
 
 class ReactionType:
     """Base class for reaction types in Telegram."""
@@ -8,17 +11,15 @@ class ReactionType:
         self.type = type
     
     @classmethod
-    def _parse(cls, client, reaction_data: dict):
+    def _parse(cls, reaction_data: dict):
         """Parse a ReactionType object from the Telegram API response."""
         if not reaction_data:
             return None
             
         reaction_type = reaction_data.get("type")
-        
-        if reaction_type == "emoji":
-            return ReactionTypeEmoji._parse(client, reaction_data)
-        elif reaction_type == "custom_emoji":
-            return ReactionTypeCustomEmoji._parse(client, reaction_data)
+        parse = _REACTION_DISPATCH.get(reaction_type)
+        if parse is not None:
+            return parse(reaction_data)
         
         return cls(type=reaction_type)
     
@@ -29,16 +30,23 @@ class ReactionType:
         }
 
 
+@dataclass(**DATACLASS_SLOTS, frozen=True)
 class ReactionTypeEmoji(ReactionType):
-    """Represents a reaction with a basic emoji."""
+    """Represents a reaction with a basic emoji.
+    
+    Instances are immutable, so parsed instances are shared between updates
+    carrying the same emoji.
+    """
     
-    def __init__(self, emoji: str):
-        super().__init__(type="emoji")
-        self.emoji = emoji
+    emoji: str
+    type: str = field(default="emoji", init=False)
     
     @classmethod
-    def _parse(cls, client, reaction_data: dict):
+    def _parse(cls, reaction_data: dict):
         """Parse a ReactionTypeEmoji object from the Telegram API response."""
+        if cls is ReactionTypeEmoji:
+            return _make_emoji(reaction_data.get("emoji"))
+            
         return cls(
             emoji=reaction_data.get("emoji")
         )
@@ -46,7 +54,7 @@ class ReactionTypeEmoji(ReactionType):
     def to_dict(self):
         """Convert the ReactionTypeEmoji object to a dictionary."""
         return {
-            "type": self.type,
+            "type": "emoji",
             "emoji": self.emoji
         }
 
@@ -59,7 +67,7 @@ class ReactionTypeCustomEmoji(ReactionType):
         self.custom_emoji_id = custom_emoji_id
     
     @classmethod
-    def _parse(cls, client, reaction_data: dict):
+    def _parse(cls, reaction_data: dict):
         """Parse a ReactionTypeCustomEmoji object from the Telegram API response."""
         return cls(
             custom_emoji_id=reaction_data.get("custom_emoji_id")
@@ -68,12 +76,27 @@ class ReactionTypeCustomEmoji(ReactionType):
     def to_dict(self):
         """Convert the ReactionTypeCustomEmoji object to a dictionary."""
         return {
-            "type": self.type,
+            "type": "custom_emoji",
             "custom_emoji_id": self.custom_emoji_id
         }
 
 
-@dataclass
+# The set of reaction emojis is small, so parsed reactions are shared
+_make_emoji = lru_cache(maxsize=256)(ReactionTypeEmoji)
+
+# Parsers of the concrete reaction types, keyed by the "type" field
+_REACTION_DISPATCH = {
+    "emoji": ReactionTypeEmoji._parse,
+    "custom_emoji": ReactionTypeCustomEmoji._parse
+}
+
+
+@generate_to_dict(
+    required=("type", "total_count", "is_me"),
+    optional=("is_big",),
+    nested=("type",)
+)
+@dataclass(**DATACLASS_SLOTS)
 class MessageReaction:
     """This object represents a reaction to a message along with the number of times it was added.
     
@@ -97,33 +120,21 @@ class MessageReaction:
     is_big: bool = None
     
     @classmethod
-    def _parse(cls, client, reaction_data: dict):
+    def _parse(cls, reaction_data: dict):
         """Parse a MessageReaction object from the Telegram API response."""
         if not reaction_data:
             return None
             
+        get = reaction_data.get
         return cls(
-            type=ReactionType._parse(client, reaction_data.get("type", {})),
-            total_count=reaction_data.get("total_count"),
-            is_me=reaction_data.get("is_me"),
-            is_big=reaction_data.get("is_big")
+            ReactionType._parse(get("type")),
+            get("total_count"),
+            get("is_me"),
+            get("is_big")
         )
-    
-    def to_dict(self):
-        """Convert the MessageReaction object to a dictionary."""
-        result = {
-            "type": self.type.to_dict(),
-            "total_count": self.total_count,
-            "is_me": self.is_me
-        }
-        
-        if self.is_big is not None:
-            result["is_big"] = self.is_big
-            
-        return result
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReactionCount:
     """This object represents a reaction added to a message along with its count.
     
@@ -139,14 +150,14 @@ class ReactionCount:
     total_count: int
     
     @classmethod
-    def _parse(cls, client, count_data: dict):
+    def _parse(cls, count_data: dict):
         """Parse a ReactionCount object from the Telegram API response."""
         if not count_data:
             return None
             
         return cls(
-            type=ReactionType._parse(client, count_data.get("type", {})),
-            total_count=count_data.get("total_count")
+            ReactionType._parse(count_data.get("type")),
+            count_data.get("total_count")
         )
     
     def to_dict(self):
@@ -1,7 +1,13 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Optional
+from ._codegen import generate_to_dict
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@generate_to_dict(
+    required=("keyboard",),
+    optional=("resize_keyboard", "one_time_keyboard", "input_field_placeholder", "selective")
+)
+@dataclass(**DATACLASS_SLOTS)
 class ReplyKeyboardMarkup:
     """This object represents a custom keyboard with reply options.
     
@@ -51,19 +57,4 @@ class ReplyKeyboardMarkup:
         Returns:
             :obj:`ReplyKeyboardMarkup`: The reply keyboard with the new row.
         """
-        return self.add(*buttons)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the object to a dict suitable for JSON serialization."""
-        result = {"keyboard": self.keyboard}
-        
-        if self.resize_keyboard is not None:
-            result["resize_keyboard"] = self.resize_keyboard
-        if self.one_time_keyboard is not None:
-            result["one_time_keyboard"] = self.one_time_keyboard
-        if self.input_field_placeholder is not None:
-            result["input_field_placeholder"] = self.input_field_placeholder
-        if self.selective is not None:
-            result["selective"] = self.selective
-            
-        return result 
\ No newline at end of file
+        return self.add(*buttons) 
\ No newline at end of file
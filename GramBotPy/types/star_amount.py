@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StarAmount:
     """This object represents an amount of Telegram Stars.
     
@@ -16,15 +17,15 @@ class StarAmount:
     nanostar_amount: int
     
     @classmethod
-    def _parse(cls, client, amount_data: dict):
+    def _parse(cls, amount_data: dict):
         """Parse a StarAmount object from the Telegram API response."""
         if not amount_data:
             return None
             
-        return cls(
-            star_count=amount_data.get("star_count", 0),
-            nanostar_amount=amount_data.get("nanostar_amount", 0)
-        )
+        obj = cls.__new__(cls)
+        obj.star_count = amount_data.get("star_count", 0)
+        obj.nanostar_amount = amount_data.get("nanostar_amount", 0)
+        return obj
         
     def to_dict(self):
         """Convert the StarAmount object to a dictionary."""
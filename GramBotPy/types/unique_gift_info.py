@@ -1,7 +1,12 @@
 import typing
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import methodcaller
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+_to_dict = methodcaller("to_dict")
+
+@dataclass(**DATACLASS_SLOTS)
 class UniqueGiftSymbol:
     """This object represents a symbol for a unique gift.
     
@@ -21,16 +26,17 @@ class UniqueGiftSymbol:
     rotation: float
     
     @classmethod
-    def _parse(cls, client, symbol_data: dict):
+    def _parse(cls, symbol_data: dict):
         """Parse a UniqueGiftSymbol object from the Telegram API response."""
         if not symbol_data:
             return None
             
-        return cls(
-            symbol=symbol_data.get("symbol"),
-            position=symbol_data.get("position"),
-            rotation=symbol_data.get("rotation")
-        )
+        get = symbol_data.get
+        obj = cls.__new__(cls)
+        obj.symbol = get("symbol")
+        obj.position = get("position")
+        obj.rotation = get("rotation")
+        return obj
         
     def to_dict(self):
         """Convert the UniqueGiftSymbol object to a dictionary."""
@@ -40,7 +46,7 @@ class UniqueGiftSymbol:
             "rotation": self.rotation
         }
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS, frozen=True)
 class UniqueGiftBackdropColors:
     """This object represents backdrop colors for a unique gift.
     
@@ -56,15 +62,12 @@ class UniqueGiftBackdropColors:
     bottom_color: str
     
     @classmethod
-    def _parse(cls, client, colors_data: dict):
+    def _parse(cls, colors_data: dict):
         """Parse a UniqueGiftBackdropColors object from the Telegram API response."""
         if not colors_data:
             return None
             
-        return cls(
-            top_color=colors_data.get("top_color"),
-            bottom_color=colors_data.get("bottom_color")
-        )
+        return _make_colors(colors_data.get("top_color"), colors_data.get("bottom_color"))
         
     def to_dict(self):
         """Convert the UniqueGiftBackdropColors object to a dictionary."""
@@ -73,7 +76,12 @@ class UniqueGiftBackdropColors:
             "bottom_color": self.bottom_color
         }
 
-@dataclass
+@lru_cache(maxsize=256)
+def _make_colors(top_color: str, bottom_color: str) -> UniqueGiftBackdropColors:
+    """Return the shared UniqueGiftBackdropColors instance for a color pair."""
+    return UniqueGiftBackdropColors(top_color, bottom_color)
+
+@dataclass(**DATACLASS_SLOTS)
 class UniqueGiftBackdrop:
     """This object represents a backdrop for a unique gift.
     
@@ -89,19 +97,18 @@ class UniqueGiftBackdrop:
     colors: UniqueGiftBackdropColors = None
     
     @classmethod
-    def _parse(cls, client, backdrop_data: dict):
+    def _parse(cls, backdrop_data: dict):
         """Parse a UniqueGiftBackdrop object from the Telegram API response."""
         if not backdrop_data:
             return None
             
-        colors = None
-        if backdrop_data.get("colors"):
-            colors = UniqueGiftBackdropColors._parse(client, backdrop_data.get("colors"))
-            
-        return cls(
-            type=backdrop_data.get("type"),
-            colors=colors
-        )
+        colors = backdrop_data.get("colors")
+        colors = UniqueGiftBackdropColors._parse(colors) if colors else None
+        
+        obj = cls.__new__(cls)
+        obj.type = backdrop_data.get("type")
+        obj.colors = colors
+        return obj
         
     def to_dict(self):
         """Convert the UniqueGiftBackdrop object to a dictionary."""
@@ -114,7 +121,7 @@ class UniqueGiftBackdrop:
             
         return result
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UniqueGiftModel:
     """This object represents a model for a unique gift.
     
@@ -130,27 +137,28 @@ class UniqueGiftModel:
     backdrop: UniqueGiftBackdrop
     
     @classmethod
-    def _parse(cls, client, model_data: dict):
+    def _parse(cls, model_data: dict):
         """Parse a UniqueGiftModel object from the Telegram API response."""
         if not model_data:
             return None
             
-        symbols = [UniqueGiftSymbol._parse(client, symbol) for symbol in model_data.get("symbols", [])]
-        backdrop = UniqueGiftBackdrop._parse(client, model_data.get("backdrop"))
+        parse_symbol = UniqueGiftSymbol._parse
+        symbols = [parse_symbol(symbol) for symbol in model_data.get("symbols") or ()]
+        backdrop = UniqueGiftBackdrop._parse(model_data.get("backdrop"))
             
-        return cls(
-            symbols=symbols,
-            backdrop=backdrop
-        )
+        obj = cls.__new__(cls)
+        obj.symbols = symbols
+        obj.backdrop = backdrop
+        return obj
         
     def to_dict(self):
         """Convert the UniqueGiftModel object to a dictionary."""
         return {
-            "symbols": [symbol.to_dict() for symbol in self.symbols],
+            "symbols": list(map(_to_dict, self.symbols)),
             "backdrop": self.backdrop.to_dict()
         }
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UniqueGiftInfo:
     """This object represents information about a unique gift.
     
@@ -174,19 +182,9 @@ class UniqueGiftInfo:
     model: UniqueGiftModel
     
     @classmethod
-    def _parse(cls, client, gift_data: dict):
+    def _parse(cls, gift_data: dict):
         """Parse a UniqueGiftInfo object from the Telegram API response."""
-        if not gift_data:
-            return None
-            
-        model = UniqueGiftModel._parse(client, gift_data.get("model"))
-            
-        return cls(
-            telegram_payment_charge_id=gift_data.get("telegram_payment_charge_id"),
-            provider_payment_charge_id=gift_data.get("provider_payment_charge_id"),
-            gift_star_count=gift_data.get("gift_star_count"),
-            model=model
-        )
+        return _parse_unique_gift_info(cls, gift_data)
         
     def to_dict(self):
         """Convert the UniqueGiftInfo object to a dictionary."""
@@ -195,4 +193,58 @@ class UniqueGiftInfo:
             "provider_payment_charge_id": self.provider_payment_charge_id,
             "gift_star_count": self.gift_star_count,
             "model": self.model.to_dict()
-        } 
\ No newline at end of file
+        } 
+
+
+def _parse_unique_gift_info(cls, gift_data: dict):
+    """Parse a UniqueGiftInfo and its nested model in one function.
+
+    Equivalent to the nested ``_parse`` calls of the model, backdrop, colors and
+    symbols, without their per-object call overhead.
+    """
+    if not gift_data:
+        return None
+
+    model = gift_data.get("model")
+    if model:
+        symbols = []
+        append = symbols.append
+        new_symbol = UniqueGiftSymbol.__new__
+        for symbol_data in model.get("symbols") or ():
+            if not symbol_data:
+                append(None)
+                continue
+            get = symbol_data.get
+            symbol = new_symbol(UniqueGiftSymbol)
+            symbol.symbol = get("symbol")
+            symbol.position = get("position")
+            symbol.rotation = get("rotation")
+            append(symbol)
+
+        backdrop = model.get("backdrop")
+        if backdrop:
+            colors = backdrop.get("colors")
+            if colors:
+                colors = _make_colors(colors.get("top_color"), colors.get("bottom_color"))
+            else:
+                colors = None
+            backdrop_data = backdrop
+            backdrop = UniqueGiftBackdrop.__new__(UniqueGiftBackdrop)
+            backdrop.type = backdrop_data.get("type")
+            backdrop.colors = colors
+        else:
+            backdrop = None
+
+        model = UniqueGiftModel.__new__(UniqueGiftModel)
+        model.symbols = symbols
+        model.backdrop = backdrop
+    else:
+        model = None
+
+    get = gift_data.get
+    gift = cls.__new__(cls)
+    gift.telegram_payment_charge_id = get("telegram_payment_charge_id")
+    gift.provider_payment_charge_id = get("provider_payment_charge_id")
+    gift.gift_star_count = get("gift_star_count")
+    gift.model = model
+    return gift
\ No newline at end of file
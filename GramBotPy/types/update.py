@@ -1,7 +1,40 @@
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, ClassVar, Type, TypeVar
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any
 
-T = TypeVar('T', bound='Update')
+
+def _parse_message(client: Any, data: Dict[str, Any]) -> Any:
+    from .message import Message
+    return Message._parse(client, data)
+
+
+def _parse_callback_query(client: Any, data: Dict[str, Any]) -> Any:
+    from .callback_query import CallbackQuery
+    return CallbackQuery._parse(client, data)
+
+
+class _LazyPayload:
+    """Field descriptor keeping the raw API dict and parsing it on first access.
+    
+    Values that are not dicts, such as already parsed objects, are returned as is.
+    """
+    
+    def __init__(self, parse):
+        self.parse = parse
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            # Default value used by the dataclass __init__
+            return None
+        value = instance.__dict__.get(self.name)
+        if type(value) is dict and value:
+            value = instance.__dict__[self.name] = self.parse(instance._client, value)
+        return value
+    
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
 
 @dataclass
 class Update:
@@ -52,16 +85,19 @@ class Update:
             
         chat_join_request (``dict``, optional):
             A request to join the chat has been sent.
+            
+    ``message`` and ``callback_query`` are returned as :obj:`Message` and
+    :obj:`CallbackQuery` objects, parsed on first access.
     """
     
     update_id: int
-    message: Optional[Dict[str, Any]] = None
+    message: Optional[Dict[str, Any]] = _LazyPayload(_parse_message)
     edited_message: Optional[Dict[str, Any]] = None
     channel_post: Optional[Dict[str, Any]] = None
     edited_channel_post: Optional[Dict[str, Any]] = None
     inline_query: Optional[Dict[str, Any]] = None
     chosen_inline_result: Optional[Dict[str, Any]] = None
-    callback_query: Optional[Dict[str, Any]] = None
+    callback_query: Optional[Dict[str, Any]] = _LazyPayload(_parse_callback_query)
     shipping_query: Optional[Dict[str, Any]] = None
     pre_checkout_query: Optional[Dict[str, Any]] = None
     poll: Optional[Dict[str, Any]] = None
@@ -71,20 +107,11 @@ class Update:
     chat_join_request: Optional[Dict[str, Any]] = None
     _client: Any = field(default=None, repr=False)
     
-    def __post_init__(self):
-        # Convert dictionaries to appropriate types if needed
-        if self.message:
-            if isinstance(self.message, dict):
-                from .message import Message
-                self.message = Message._parse(self._client, self.message)
-            
-        if self.callback_query:
-            if isinstance(self.callback_query, dict):
-                from .callback_query import CallbackQuery
-                self.callback_query = CallbackQuery._parse(self._client, self.callback_query)
+    # message and callback_query are parsed from their dicts on first access,
+    # so handlers only pay for the payload they read
     
     @classmethod
-    def _parse(cls: Type[T], client: Any, data: Dict[str, Any]) -> T:
+    def _parse(cls, client: Any, data: Dict[str, Any]) -> "Update":
         """Parse an update from Telegram API response.
         
         Parameters:
@@ -94,23 +121,56 @@ class Update:
         Returns:
             An Update instance.
         """
-        update = cls(
-            update_id=data["update_id"],
-            message=data.get("message"),
-            edited_message=data.get("edited_message"),
-            channel_post=data.get("channel_post"),
-            edited_channel_post=data.get("edited_channel_post"),
-            inline_query=data.get("inline_query"),
-            chosen_inline_result=data.get("chosen_inline_result"),
-            callback_query=data.get("callback_query"),
-            shipping_query=data.get("shipping_query"),
-            pre_checkout_query=data.get("pre_checkout_query"),
-            poll=data.get("poll"),
-            poll_answer=data.get("poll_answer"),
-            my_chat_member=data.get("my_chat_member"),
-            chat_member=data.get("chat_member"),
-            chat_join_request=data.get("chat_join_request"),
-            _client=client
-        )
-        
-        return update 
\ No newline at end of file
+        get = data.get
+        # Arguments are passed positionally, in field order
+        return cls(
+            data["update_id"],
+            get("message"),
+            get("edited_message"),
+            get("channel_post"),
+            get("edited_channel_post"),
+            get("inline_query"),
+            get("chosen_inline_result"),
+            get("callback_query"),
+            get("shipping_query"),
+            get("pre_checkout_query"),
+            get("poll"),
+            get("poll_answer"),
+            get("my_chat_member"),
+            get("chat_member"),
+            get("chat_join_request"),
+            client
+        ) 
+
+
+def _build_parse_fast(cls):
+    """Generate a straight-line ``(client, data) -> Update`` constructor.
+    
+    The instance is created with ``__new__`` and its ``__dict__`` is set from a
+    single dict literal, skipping ``__init__`` and the call argument handling.
+    """
+    items = []
+    for f in fields(cls):
+        if f.name == "_client":
+            items.append("        '_client': client")
+        elif f.name == "update_id":
+            items.append("        'update_id': data['update_id']")
+        else:
+            items.append(f"        {f.name!r}: get({f.name!r})")
+    source = "\n".join([
+        "def _parse_fast(client, data):",
+        "    get = data.get",
+        "    obj = new(cls)",
+        "    obj.__dict__ = {",
+        ",\n".join(items),
+        "    }",
+        "    return obj"
+    ])
+    namespace = {"new": object.__new__, "cls": cls}
+    exec(source, namespace)
+    parse_fast = namespace["_parse_fast"]
+    parse_fast.__qualname__ = f"{cls.__qualname__}._parse_fast"
+    return staticmethod(parse_fast)
+
+
+Update._parse_fast = _build_parse_fast(Update)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class User:
     """This object represents a Telegram user or bot.
     
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Venue:
     """This object represents a venue.
     
@@ -1,7 +1,15 @@
 from dataclasses import dataclass
 from typing import Optional
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+# MIME types voice notes are usually sent with; any other value is kept as sent
+VOICE_MIME_TYPES = (
+    "audio/ogg", "audio/mpeg", "audio/mp4", "audio/x-m4a", "audio/aac",
+    "audio/wav", "audio/x-wav", "audio/webm", "audio/opus", "audio/flac"
+)
+_MIME_TYPES = {mime_type: mime_type for mime_type in VOICE_MIME_TYPES}
+
+@dataclass(**DATACLASS_SLOTS, frozen=True)
 class Voice:
     """This object represents a voice note.
     
@@ -27,4 +35,9 @@ class Voice:
     file_unique_id: str
     duration: int
     mime_type: Optional[str] = None
-    file_size: Optional[int] = None 
\ No newline at end of file
+    file_size: Optional[int] = None
+    
+    def __post_init__(self):
+        # Known MIME types share one string per type
+        if type(self.mime_type) is str:
+            object.__setattr__(self, "mime_type", _MIME_TYPES.get(self.mime_type, self.mime_type)) 
\ No newline at end of file
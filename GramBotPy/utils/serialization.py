@@ -0,0 +1,75 @@
+import dataclasses
+import json
+import typing
+
+from .._compat import orjson
+
+_FIELD_NAMES: typing.Dict[type, typing.Tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> typing.Tuple[str, ...]:
+    """Return the public dataclass field names of ``cls``, computed once per class."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(
+            field.name for field in dataclasses.fields(cls) if not field.name.startswith("_")
+        )
+    return names
+
+
+def _dump_hook(obj: typing.Any) -> typing.Any:
+    """Return a JSON-serializable form of a GramBotPy object.
+
+    Objects defining ``to_dict`` are converted with it, since it knows the wire
+    format of the type (required keys, constant values). Dataclasses without
+    ``to_dict`` are read field by field, skipping ``None`` values.
+    """
+    cls = type(obj)
+    to_dict = getattr(cls, "to_dict", None)
+    if to_dict is not None:
+        return to_dict(obj)
+    if dataclasses.is_dataclass(cls):
+        result = {}
+        for name in _field_names(cls):
+            value = getattr(obj, name)
+            if value is not None:
+                result[name] = value
+        return result
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+def dumps(obj: typing.Any) -> str:
+    """Serialize a request parameter to a JSON string.
+
+    GramBotPy objects such as keyboards, command scopes and reactions can be
+    passed directly, as well as plain dicts and lists containing them.
+    ``orjson`` is used when it is installed.
+
+    Parameters:
+        obj (``typing.Any``):
+            The value to serialize.
+
+    Returns:
+        ``str``: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_dump_hook, option=orjson.OPT_PASSTHROUGH_DATACLASS).decode()
+    return json.dumps(obj, default=_dump_hook, separators=(",", ":"))
+
+
+def loads(data: typing.Union[bytes, str]) -> typing.Any:
+    """Deserialize a JSON document, such as a raw API response body.
+
+    ``orjson`` is used when it is installed, decoding the bytes directly
+    without building an intermediate ``str``.
+
+    Parameters:
+        data (``bytes`` | ``str``):
+            The JSON document.
+
+    Returns:
+        ``typing.Any``: The decoded value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
\ No newline at end of file
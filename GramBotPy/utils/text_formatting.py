@@ -1,4 +1,36 @@
-import re
+from functools import lru_cache
+
+# Markdown v1 escape characters: _ * [ ] ( )
+_MD_V1_TABLE = str.maketrans({c: "\\" + c for c in "_*[]()~`>#+-=|{}.!"})
+# Markdown v2 escape characters: _ * [ ] ( ) ~ ` > # + - = | { } . ! and the backslash
+_MD_V2_TABLE = str.maketrans({c: "\\" + c for c in "\\_*[]()~`>#+-=|{}.!"})
+_HTML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Labels, commands and usernames are escaped over and over, so results are
+# cached for them; longer texts are rarely repeated and would only evict them
+_CACHED_MAX_LENGTH = 64
+
+
+@lru_cache(maxsize=4096)
+def _escape_markdown_v1(text):
+    return text.translate(_MD_V1_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def _escape_markdown_v2(text):
+    return text.translate(_MD_V2_TABLE)
+
+
+def _escape_html(text):
+    # The substring checks are memchr scans, much cheaper than translate
+    # rebuilding a string that needs no escaping
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.translate(_HTML_TABLE)
+
+
+_escape_html_cached = lru_cache(maxsize=4096)(_escape_html)
+
 
 def escape_markdown(text, version=1):
     """Escape markdown characters in a string.
@@ -22,13 +54,15 @@ def escape_markdown(text, version=1):
             # Escape Markdown v2
             escaped_text = escape_markdown("**bold** __italic__", version=2)
     """
+    if not isinstance(text, str):
+        text = str(text)
     if version == 1:
-        # Markdown v1 escape characters: _ * [ ] ( )
-        return re.sub(r"([_*\[\]()~`>#\+\-=|{}.!])", r"\\\1", str(text))
-    else:
-        # Markdown v2 escape characters: _ * [ ] ( ) ~ ` > # + - = | { } . !
-        escape_chars = r"\_\*\[\]\(\)~`>#\+\-=\|{}.!"
-        return re.sub(f"([{re.escape(escape_chars)}])", r"\\\1", str(text))
+        if len(text) < _CACHED_MAX_LENGTH:
+            return _escape_markdown_v1(text)
+        return text.translate(_MD_V1_TABLE)
+    if len(text) < _CACHED_MAX_LENGTH:
+        return _escape_markdown_v2(text)
+    return text.translate(_MD_V2_TABLE)
 
 
 def escape_html(text):
@@ -46,4 +80,8 @@ def escape_html(text):
         
             escaped_text = escape_html("<b>bold text</b>")
     """
+    if isinstance(text, str):
+        if len(text) < _CACHED_MAX_LENGTH:
+            return _escape_html_cached(text)
+        return _escape_html(text)
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") 
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""Helpers shared by the example bots."""
+
+from GramBotPy import GramBotPy
+
+
+def get_bot(token: str) -> GramBotPy:
+    """Return a new client for ``token`` configured like every example bot.
+    
+    Each call builds a fresh client, so handlers registered by one run of
+    main() never pile up on a client reused by the next.
+    """
+    return GramBotPy(token, pool_size=100)
\ No newline at end of file
@@ -1,14 +1,20 @@
 import asyncio
+import logging
 import os
+import queue
 import sys
 import json
-from datetime import datetime, timedelta
+import time
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from datetime import datetime
 
 # Add parent directory to path so Python can find the GramBotPy module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from GramBotPy import *
 from GramBotPy.types import *
+from _shared import get_bot
 
 """
 Complete Example of GramBotPy Features
@@ -32,31 +38,188 @@ This example demonstrates ALL features of GramBotPy including:
 16. Error handling
 """
 
+log = logging.getLogger(__name__)
+
+
+def setup_logging():
+    """Route log records through a queue drained by a background thread
+    
+    Handlers only enqueue records, so a slow stderr never blocks the event loop.
+    Returns the listener, which must be stopped on exit to flush pending records.
+    """
+    log_queue = queue.SimpleQueue()
+    output = logging.StreamHandler()
+    output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    
+    listener = QueueListener(log_queue, output)
+    listener.start()
+    return listener
+
+# Keyboards never change, so they are built once instead of on every command.
+# InlineKeyboardMarkup caches its serialized form, which is reused on every send.
+BUTTON_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Option 1", callback_data="opt1"),
+        InlineKeyboardButton("Option 2", callback_data="opt2")
+    ],
+    [
+        InlineKeyboardButton("Visit Website", url="https://example.com")
+    ],
+    [
+        InlineKeyboardButton("Show Alert", callback_data="alert")
+    ]
+])
+
+PHOTO_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Like 👍", callback_data="like_photo")],
+    [InlineKeyboardButton("Share 🔗", callback_data="share_photo")]
+])
+
+AUDIO_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Download ⬇️", callback_data="download_audio")],
+    [InlineKeyboardButton("Play ▶️", callback_data="play_audio")]
+])
+
+CONTACT_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Call Contact", callback_data="call_contact")]
+])
+
+GAME_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("Play Now", callback_game=True)]
+])
+
+HELP_TEXT = """
+Available Commands:
+/start - Start the bot
+/help - Show this help message
+/echo [text] - Echo your message
+/button - Show inline buttons
+/db - Database operations
+/file - File operations
+/sendphoto - Photo examples
+/sendaudio - Audio examples
+/sendvideo - Video examples
+/sendlocation - Location examples
+/sendcontact - Contact examples
+/sendsticker - Sticker examples
+/message - Message operations
+/group - Group management
+/inline - Inline query info
+/game - Game example
+/poll - Poll example
+/quiz - Quiz example
+/userinfo - User information
+/channel - Channel operations
+"""
+
+# Inline result offered for an empty query, the current time result is built per query
+GREETING_RESULT = {
+    "type": "article",
+    "id": "default1",
+    "title": "Send a greeting",
+    "description": "Sends 'Hello from GramBotPy!'",
+    "input_message_content": {
+        "message_text": "Hello from GramBotPy! 👋"
+    }
+}
+
+# Chat titles and types rarely change, so get_chat results are reused for a while
+CHAT_CACHE_TTL = 60.0
+CHAT_CACHE_SIZE = 1024
+_chat_cache = OrderedDict()
+
+
+async def cached_get_chat(bot, chat_id, ttl=CHAT_CACHE_TTL):
+    """Return bot.get_chat(chat_id), reusing results younger than ``ttl`` seconds"""
+    entry = _chat_cache.get(chat_id)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < ttl:
+        _chat_cache.move_to_end(chat_id)
+        return entry[1]
+    
+    chat = await bot.get_chat(chat_id)
+    _chat_cache[chat_id] = (now, chat)
+    _chat_cache.move_to_end(chat_id)
+    # Drop the least recently used chats
+    while len(_chat_cache) > CHAT_CACHE_SIZE:
+        _chat_cache.popitem(last=False)
+    return chat
+
+# Delayed actions run in the background, so handlers don't sleep while waiting.
+# The set keeps references to the pending tasks, the event loop only keeps weak ones
+_background_tasks = set()
+
+
+async def _later(delay, func, *args, **kwargs):
+    await asyncio.sleep(delay)
+    await func(*args, **kwargs)
+
+
+def run_later(delay, func, *args, **kwargs):
+    """Schedule ``await func(*args, **kwargs)`` in ``delay`` seconds and return immediately"""
+    task = asyncio.create_task(_later(delay, func, *args, **kwargs))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def gather_logged(*aws):
+    """Run ``aws`` concurrently, logging the ones that fail without cancelling the others"""
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            log.error("Concurrent request failed: %s", result, exc_info=result)
+    return results
+
+# Formatted wall-clock time, rebuilt at most once per second: [second, iso, hh:mm:ss]
+_now_cache = [None, "", ""]
+
+
+def _now_strings():
+    second = int(time.time())
+    if _now_cache[0] != second:
+        now = datetime.fromtimestamp(second)
+        _now_cache[:] = [second, now.isoformat(), now.strftime("%H:%M:%S")]
+    return _now_cache
+
+
+def now_iso():
+    """Return the current local time in ISO format, to the second"""
+    return _now_strings()[1]
+
+
+def now_hms():
+    """Return the current local time as HH:MM:SS"""
+    return _now_strings()[2]
+
 async def main():
     # Initialize bot with your token
-    bot = GramBotPy("7361511720:AAHqI8PNFoi0NItdufzgilVaeN5rhVJDdQo")
+    bot = get_bot("7361511720:AAHqI8PNFoi0NItdufzgilVaeN5rhVJDdQo")
     
     # Delete any existing webhook before using getUpdates method
-    print("Deleting webhook...")
+    log.info("Deleting webhook...")
     result = await bot.delete_webhook(drop_pending_updates=True)
     if result:
-        print("Successfully deleted webhook!")
-        print("Now the bot can use getUpdates method without the 409 error.")
+        log.info("Successfully deleted webhook!")
+        log.info("Now the bot can use getUpdates method without the 409 error.")
     else:
-        print("Failed to delete webhook.")
+        log.warning("Failed to delete webhook.")
     
     await bot.start()
     
-    print("=== GRAMBOTPY COMPLETE EXAMPLE ===")
+    log.info("=== GRAMBOTPY COMPLETE EXAMPLE ===")
     
     # ===== BASIC COMMANDS =====
     @bot.command("start")
     async def start_command(message: Message):
         """Handle /start command"""
         # Check for deep linking parameters
-        args = message.text.split()
-        if len(args) > 1:
-            deep_link_param = args[1]
+        deep_link_param = message.command_args.strip()
+        if deep_link_param:
             await message.reply(
                 f"Welcome to GramBotPy! 🚀\n"
                 f"You came here with parameter: {deep_link_param}\n"
@@ -71,36 +234,13 @@ async def main():
     @bot.command("help")
     async def help_command(message: Message):
         """Handle /help command"""
-        help_text = """
-Available Commands:
-/start - Start the bot
-/help - Show this help message
-/echo [text] - Echo your message
-/button - Show inline buttons
-/db - Database operations
-/file - File operations
-/sendphoto - Photo examples
-/sendaudio - Audio examples
-/sendvideo - Video examples
-/sendlocation - Location examples
-/sendcontact - Contact examples
-/sendsticker - Sticker examples
-/message - Message operations
-/group - Group management
-/inline - Inline query info
-/game - Game example
-/poll - Poll example
-/quiz - Quiz example
-/userinfo - User information
-/channel - Channel operations
-"""
-        await message.reply(help_text)
+        await message.reply(HELP_TEXT)
     
     @bot.command("echo")
     async def echo_command(message: Message):
         """Handle /echo command"""
-        if len(message.text.split()) > 1:
-            text = " ".join(message.text.split()[1:])
+        text = message.command_args.strip()
+        if text:
             await message.reply(f"Echo: {text}")
         else:
             await message.reply("Please provide text to echo!")
@@ -109,22 +249,9 @@ Available Commands:
     @bot.command("button")
     async def button_command(message: Message):
         """Show inline keyboard buttons"""
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("Option 1", callback_data="opt1"),
-                InlineKeyboardButton("Option 2", callback_data="opt2")
-            ],
-            [
-                InlineKeyboardButton("Visit Website", url="https://example.com")
-            ],
-            [
-                InlineKeyboardButton("Show Alert", callback_data="alert")
-            ]
-        ])
-        
         await message.reply(
             "Choose an option:",
-            reply_markup=keyboard
+            reply_markup=BUTTON_KEYBOARD
         )
     
     @bot.callback_query("opt1")
@@ -154,20 +281,15 @@ Available Commands:
         products = db.collection("products", "@your_products_channel")
         
         # Insert user data
+        sender = message.from_user
         user_data = {
-            "user_id": message.from_user.id,
-            "username": message.from_user.username,
-            "first_name": message.from_user.first_name,
-            "last_name": message.from_user.last_name,
-            "joined_date": datetime.now().isoformat()
+            "user_id": sender.id,
+            "username": sender.username,
+            "first_name": sender.first_name,
+            "last_name": sender.last_name,
+            "joined_date": now_iso()
         }
         
-        # Insert document
-        result = await users.insert_one(user_data)
-        
-        # Find user
-        user = await users.find_one({"user_id": message.from_user.id})
-        
         # Insert product data
         product_data = {
             "name": "Sample Product",
@@ -175,14 +297,21 @@ Available Commands:
             "category": "Electronics",
             "in_stock": True,
             "tags": ["sample", "electronics", "new"],
-            "created_at": datetime.now().isoformat()
+            "created_at": now_iso()
         }
         
-        # Insert product
-        product_result = await products.insert_one(product_data)
+        # The inserts target different channels, so they can run concurrently
+        result, product_result = await asyncio.gather(
+            users.insert_one(user_data),
+            products.insert_one(product_data)
+        )
         
-        # Find products
-        all_products = await products.find({"in_stock": True})
+        # Find user and products, and count documents, concurrently too
+        user, all_products, product_count = await asyncio.gather(
+            users.find_one({"user_id": sender.id}),
+            products.find({"in_stock": True}),
+            products.count_documents()
+        )
         
         # Update a product
         await products.update_one(
@@ -190,9 +319,6 @@ Available Commands:
             {"price": 89.99, "in_stock": False}
         )
         
-        # Count documents
-        product_count = await products.count_documents()
-        
         # Delete a document
         await products.delete_one({"name": "Sample Product"})
         
@@ -210,179 +336,166 @@ Available Commands:
     @bot.command("file")
     async def file_command(message: Message):
         """Demonstrate file operations"""
-        # Send a file
-        await message.reply_document(
-            document="path/to/your/file.txt",
-            caption="Here's a file!"
-        )
-        
-        # Send a photo
-        await message.reply_photo(
-            photo="path/to/your/photo.jpg",
-            caption="Here's a photo!"
-        )
-        
-        # Send multiple photos as album
-        await message.reply_media_group([
-            {
-                "type": "photo",
-                "media": "path/to/photo1.jpg",
-                "caption": "Photo 1"
-            },
-            {
-                "type": "photo",
-                "media": "path/to/photo2.jpg",
-                "caption": "Photo 2"
-            }
-        ])
-        
-        # Send audio file
-        await message.reply_audio(
-            audio="path/to/your/audio.mp3",
-            title="Song Title",
-            performer="Artist Name",
-            duration=180,  # Duration in seconds
-            caption="Here's an audio file!"
-        )
-        
-        # Send voice message
-        await message.reply_voice(
-            voice="path/to/your/voice.ogg",
-            duration=30,  # Duration in seconds
-            caption="Here's a voice message!"
+        # The sends don't depend on each other, so they run concurrently.
+        # A failed upload is logged without cancelling the rest.
+        await gather_logged(
+            # Send a file
+            message.reply_document(
+                document="path/to/your/file.txt",
+                caption="Here's a file!"
+            ),
+            # Send a photo
+            message.reply_photo(
+                photo="path/to/your/photo.jpg",
+                caption="Here's a photo!"
+            ),
+            # Send multiple photos as album
+            message.reply_media_group([
+                {
+                    "type": "photo",
+                    "media": "path/to/photo1.jpg",
+                    "caption": "Photo 1"
+                },
+                {
+                    "type": "photo",
+                    "media": "path/to/photo2.jpg",
+                    "caption": "Photo 2"
+                }
+            ]),
+            # Send audio file
+            message.reply_audio(
+                audio="path/to/your/audio.mp3",
+                title="Song Title",
+                performer="Artist Name",
+                duration=180,  # Duration in seconds
+                caption="Here's an audio file!"
+            ),
+            # Send voice message
+            message.reply_voice(
+                voice="path/to/your/voice.ogg",
+                duration=30,  # Duration in seconds
+                caption="Here's a voice message!"
+            )
         )
         
-        # Download file example
+        # Download file example, streamed to disk chunk by chunk
         if message.document:
-            file_info = await bot.get_file(message.document.file_id)
-            downloaded_file = await bot.download_file(file_info.file_path)
-            
-            # Save to disk
-            with open("downloaded_file.txt", "wb") as f:
-                f.write(downloaded_file)
-            
+            await bot.download_media(message, "downloaded_file.txt")
             await message.reply("File downloaded successfully!")
 
     @bot.command("sendphoto")
     async def send_photo_command(message: Message):
         """Send photo with different options"""
-        # Send photo with caption
-        await message.reply_photo(
-            photo="https://enhanceaiart.s3.us-west-2.amazonaws.com/uploads/bcac916a-25aa-4ad5-9a65-f1b199f08ad9.png",
-            caption="Beautiful sunset! 🌅",
-            parse_mode="HTML"
-        )
-        
-        # Send photo with custom keyboard
-        keyboard = InlineKeyboardMarkup([
-            [InlineKeyboardButton("Like 👍", callback_data="like_photo")],
-            [InlineKeyboardButton("Share 🔗", callback_data="share_photo")]
-        ])
-        
-        await message.reply_photo(
-            photo="path/to/photo.jpg",
-            caption="Photo with interactive buttons!",
-            reply_markup=keyboard
-        )
-        
-        # Send photo by URL
-        await message.reply_photo(
-            photo="https://example.com/photo.jpg",
-            caption="Photo from URL"
-        )
+        sends = [
+            # Send photo with caption
+            message.reply_photo(
+                photo="https://enhanceaiart.s3.us-west-2.amazonaws.com/uploads/bcac916a-25aa-4ad5-9a65-f1b199f08ad9.png",
+                caption="Beautiful sunset! 🌅",
+                parse_mode="HTML"
+            ),
+            # Send photo with custom keyboard
+            message.reply_photo(
+                photo="path/to/photo.jpg",
+                caption="Photo with interactive buttons!",
+                reply_markup=PHOTO_KEYBOARD
+            ),
+            # Send photo by URL
+            message.reply_photo(
+                photo="https://example.com/photo.jpg",
+                caption="Photo from URL"
+            )
+        ]
         
         # Send photo by file_id (if available)
         if message.photo:
             file_id = message.photo[-1].file_id  # Get largest photo file_id
-            await message.reply_photo(
+            sends.append(message.reply_photo(
                 photo=file_id,
                 caption="Photo sent using file_id"
-            )
+            ))
+        
+        await gather_logged(*sends)
 
     @bot.command("sendaudio")
     async def send_audio_command(message: Message):
         """Send audio with different options"""
-        # Send audio file with metadata
-        await message.reply_audio(
-            audio="path/to/song.mp3",
-            title="Amazing Song",
-            performer="Famous Artist",
-            duration=240,  # 4 minutes
-            caption="🎵 Listen to this amazing track!",
-            thumb="path/to/thumbnail.jpg"  # Optional thumbnail
-        )
-        
-        # Send voice message
-        await message.reply_voice(
-            voice="path/to/voice.ogg",
-            duration=45,  # 45 seconds
-            caption="🎤 Voice message"
-        )
-        
-        # Send audio with custom keyboard
-        keyboard = InlineKeyboardMarkup([
-            [InlineKeyboardButton("Download ⬇️", callback_data="download_audio")],
-            [InlineKeyboardButton("Play ▶️", callback_data="play_audio")]
-        ])
-        
-        await message.reply_audio(
-            audio="path/to/audio.mp3",
-            title="Interactive Audio",
-            performer="Artist",
-            duration=180,
-            caption="Audio with interactive buttons!",
-            reply_markup=keyboard
-        )
+        sends = [
+            # Send audio file with metadata
+            message.reply_audio(
+                audio="path/to/song.mp3",
+                title="Amazing Song",
+                performer="Famous Artist",
+                duration=240,  # 4 minutes
+                caption="🎵 Listen to this amazing track!",
+                thumb="path/to/thumbnail.jpg"  # Optional thumbnail
+            ),
+            # Send voice message
+            message.reply_voice(
+                voice="path/to/voice.ogg",
+                duration=45,  # 45 seconds
+                caption="🎤 Voice message"
+            ),
+            # Send audio with custom keyboard
+            message.reply_audio(
+                audio="path/to/audio.mp3",
+                title="Interactive Audio",
+                performer="Artist",
+                duration=180,
+                caption="Audio with interactive buttons!",
+                reply_markup=AUDIO_KEYBOARD
+            )
+        ]
         
         # Send audio by file_id (if available)
         if message.audio:
             file_id = message.audio.file_id
-            await message.reply_audio(
+            sends.append(message.reply_audio(
                 audio=file_id,
                 caption="Audio sent using file_id"
-            )
+            ))
+        
+        await gather_logged(*sends)
 
     @bot.command("sendvideo")
     async def send_video_command(message: Message):
         """Send video with different options"""
-        # Send video file
-        await message.reply_video(
-            video="path/to/video.mp4",
-            caption="Check out this video!",
-            width=1280,
-            height=720,
-            duration=60,  # 1 minute
-            supports_streaming=True
-        )
-        
-        # Send video note (round message)
-        await message.reply_video_note(
-            video_note="path/to/video_note.mp4",
-            duration=15,
-            length=240  # Video note dimension (it's a square)
-        )
-        
-        # Send mixed media group (photos and videos)
-        await message.reply_media_group([
-            {
-                "type": "photo",
-                "media": "path/to/photo.jpg",
-                "caption": "Mixed media album"
-            },
-            {
-                "type": "video",
-                "media": "path/to/video.mp4",
-                "caption": "Video in album"
-            }
-        ])
-        
-        # Send animation (GIF)
-        await message.reply_animation(
-            animation="path/to/animation.gif",
-            caption="Funny GIF",
-            width=480,
-            height=320,
-            duration=5
+        await gather_logged(
+            # Send video file
+            message.reply_video(
+                video="path/to/video.mp4",
+                caption="Check out this video!",
+                width=1280,
+                height=720,
+                duration=60,  # 1 minute
+                supports_streaming=True
+            ),
+            # Send video note (round message)
+            message.reply_video_note(
+                video_note="path/to/video_note.mp4",
+                duration=15,
+                length=240  # Video note dimension (it's a square)
+            ),
+            # Send mixed media group (photos and videos)
+            message.reply_media_group([
+                {
+                    "type": "photo",
+                    "media": "path/to/photo.jpg",
+                    "caption": "Mixed media album"
+                },
+                {
+                    "type": "video",
+                    "media": "path/to/video.mp4",
+                    "caption": "Video in album"
+                }
+            ]),
+            # Send animation (GIF)
+            message.reply_animation(
+                animation="path/to/animation.gif",
+                caption="Funny GIF",
+                width=480,
+                height=320,
+                duration=5
+            )
         )
 
     @bot.command("sendlocation")
@@ -423,15 +536,11 @@ Available Commands:
         )
         
         # Send multiple contacts with keyboard
-        keyboard = InlineKeyboardMarkup([
-            [InlineKeyboardButton("Call Contact", callback_data="call_contact")]
-        ])
-        
         await message.reply_contact(
             phone_number="+9876543210",
             first_name="Jane",
             last_name="Smith",
-            reply_markup=keyboard
+            reply_markup=CONTACT_KEYBOARD
         )
 
     @bot.command("sendsticker")
@@ -469,9 +578,10 @@ Available Commands:
             parse_mode="Markdown"
         )
         
-        # Edit message
-        await asyncio.sleep(2)
-        await formatted_message.edit_text(
+        # Edit message in 2 seconds
+        run_later(
+            2,
+            formatted_message.edit_text,
             "This message has been *edited*!",
             parse_mode="Markdown"
         )
@@ -496,8 +606,7 @@ Available Commands:
         
         # Delete message after delay
         temp_message = await message.reply("This message will be deleted in 5 seconds...")
-        await asyncio.sleep(5)
-        await temp_message.delete()
+        run_later(5, temp_message.delete)
     
     # ===== GROUP MANAGEMENT =====
     @bot.command("group")
@@ -507,24 +616,22 @@ Available Commands:
             await message.reply("This command is for groups only!")
             return
         
-        # Get chat info
-        chat = await bot.get_chat(message.chat.id)
-        
-        # Get chat member count
-        member_count = await bot.get_chat_member_count(message.chat.id)
-        
-        # Get chat administrators
-        admins = await bot.get_chat_administrators(message.chat.id)
+        # Get chat info, member count, administrators and the bot's own
+        # permissions; the requests are independent, so they run concurrently
+        me = await bot.get_me()
+        chat, member_count, admins, bot_member = await asyncio.gather(
+            cached_get_chat(bot, message.chat.id),
+            bot.get_chat_member_count(message.chat.id),
+            bot.get_chat_administrators(message.chat.id),
+            bot.get_chat_member(message.chat.id, me.id)
+        )
         admin_usernames = [f"@{admin.user.username}" for admin in admins if admin.user.username]
         
-        # Get bot's permissions
-        bot_member = await bot.get_chat_member(message.chat.id, (await bot.get_me()).id)
-        
         # Ban a user (example only - will not actually ban anyone)
         # await bot.ban_chat_member(message.chat.id, user_id_to_ban)
         
         # Kick a user (example only - will not actually kick anyone)
-        # await bot.ban_chat_member(message.chat.id, user_id_to_kick, until_date=datetime.now() + timedelta(seconds=5))
+        # await bot.ban_chat_member(message.chat.id, user_id_to_kick, until_date=int(time.time()) + 5)
         
         # Restrict a user (example only - will not actually restrict anyone)
         # await bot.restrict_chat_member(
@@ -534,7 +641,7 @@ Available Commands:
         #         "can_send_messages": False,
         #         "can_send_media_messages": False,
         #     },
-        #     until_date=datetime.now() + timedelta(minutes=60)
+        #     until_date=int(time.time()) + 3600
         # )
         
         # Set chat title (if bot is admin)
@@ -559,9 +666,11 @@ Available Commands:
     @bot.message_handler("new_chat_members")
     async def welcome_new_members(message: Message):
         """Welcome new chat members"""
-        if hasattr(message, 'new_chat_members') and message.new_chat_members:
+        if message.new_chat_members:
+            # get_me is cached by the client, look it up once per event
+            me = await bot.get_me()
             for new_member in message.new_chat_members:
-                if new_member.get('id') == (await bot.get_me()).id:
+                if new_member.get('id') == me.id:
                     # Bot was added to a group
                     await message.reply("Thanks for adding me to this group!")
                 else:
@@ -597,22 +706,14 @@ Available Commands:
         if not query:
             # Default results when no query
             results = [
-                {
-                    "type": "article",
-                    "id": "default1",
-                    "title": "Send a greeting",
-                    "description": "Sends 'Hello from GramBotPy!'",
-                    "input_message_content": {
-                        "message_text": "Hello from GramBotPy! 👋"
-                    }
-                },
+                GREETING_RESULT,
                 {
                     "type": "article",
                     "id": "default2",
                     "title": "Send the current time",
                     "description": "Sends the current time",
                     "input_message_content": {
-                        "message_text": f"Current time: {datetime.now().strftime('%H:%M:%S')}"
+                        "message_text": f"Current time: {now_hms()}"
                     }
                 }
             ]
@@ -647,7 +748,7 @@ Available Commands:
         """Handle when a user selects an inline result"""
         # This is triggered when a user selects one of your inline results
         # You can use this to track which results are popular
-        print(f"User selected result with ID: {chosen_result.result_id}")
+        log.info("User selected result with ID: %s", chosen_result.result_id)
 
     # ===== GAMES =====
     @bot.command("game")
@@ -657,13 +758,9 @@ Available Commands:
         await message.reply_game("your_game_short_name")
         
         # Game with keyboard
-        keyboard = InlineKeyboardMarkup([
-            [InlineKeyboardButton("Play Now", callback_game=True)]
-        ])
-        
         await message.reply_game(
             "your_game_short_name",
-            reply_markup=keyboard
+            reply_markup=GAME_KEYBOARD
         )
     
     @bot.callback_query_handler()
@@ -735,7 +832,7 @@ Is Bot: {user.is_bot}
         )
         
         # Get channel info
-        channel = await bot.get_chat("@your_channel")
+        channel = await cached_get_chat(bot, "@your_channel")
         
         # Get channel member count
         # member_count = await bot.get_chat_member_count("@your_channel")
@@ -757,11 +854,27 @@ Is Bot: {user.is_bot}
     @bot.error_handler()
     async def error_handler(error):
         """Handle errors"""
-        print(f"Error occurred: {error}")
+        log.error("Error occurred: %s", error)
     
     # Keep the bot running
-    print("Bot is running...")
+    log.info("Bot is running...")
     await bot.idle()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    listener = setup_logging()
+    
+    # uvloop is optional, it replaces the default event loop with a faster one
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+        
+    try:
+        if uvloop is not None and sys.version_info >= (3, 12):
+            asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+        else:
+            if uvloop is not None:
+                uvloop.install()
+            asyncio.run(main())
+    finally:
+        listener.stop() 
\ No newline at end of file
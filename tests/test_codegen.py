@@ -0,0 +1,89 @@
+import typing
+from dataclasses import dataclass
+
+from GramBotPy.types._codegen import build_to_dict, structure
+from GramBotPy.types.animation import Animation
+from GramBotPy.types.game import Game
+from GramBotPy.types.message_entity import MessageEntity
+from GramBotPy.types.photo_size import PhotoSize
+
+PHOTO = {"file_id": "a", "file_unique_id": "b", "width": 90, "height": 90}
+ANIMATION = {"file_id": "c", "file_unique_id": "d", "width": 320, "height": 240, "duration": 3}
+
+
+def test_game_to_dict_round_trips_nested_values():
+    data = {
+        "title": "Snake",
+        "description": "Eat the apples",
+        "photo": [PHOTO],
+        "text": "High score",
+        "text_entities": [{"type": "bold", "offset": 0, "length": 4}],
+        "animation": ANIMATION
+    }
+    game = Game._parse(None, data)
+
+    result = game.to_dict()
+
+    assert result["photo"] == [PHOTO]
+    assert result["text_entities"] == [{"type": "bold", "offset": 0, "length": 4}]
+    assert isinstance(result["animation"], Animation)
+
+
+def test_game_to_dict_skips_missing_optional_fields():
+    game = Game._parse(None, {"title": "Snake", "description": "Eat the apples", "photo": [PHOTO]})
+
+    assert game.to_dict() == {"title": "Snake", "description": "Eat the apples", "photo": [PHOTO]}
+
+
+def test_game_without_photo_defaults_to_empty_list():
+    game = Game._parse(None, {"title": "Snake", "description": "Eat the apples"})
+
+    assert game.photo == []
+    assert game.to_dict()["photo"] == []
+
+
+def test_required_list_set_to_none_serializes_as_empty_list():
+    game = Game(title="Snake", description="Eat the apples", photo=None)
+
+    assert game.to_dict()["photo"] == []
+
+
+def test_truthy_fields_are_dropped_when_falsy():
+    @dataclass
+    class Sample:
+        name: str
+        tag: str = None
+        count: int = None
+
+    build_to_dict(Sample, required=("name",), optional=("tag", "count"), truthy=("tag",))
+
+    assert Sample("x", "", 0).to_dict() == {"name": "x", "count": 0}
+    assert Sample("x", "t").to_dict() == {"name": "x", "tag": "t"}
+
+
+def test_structure_builds_nested_and_from_dict_fields():
+    game = structure(
+        {
+            "title": "Snake",
+            "description": "Eat the apples",
+            "photo": [PHOTO],
+            "text_entities": [{"type": "url", "offset": 1, "length": 2}]
+        },
+        Game
+    )
+
+    assert game.photo == [PhotoSize(**PHOTO)]
+    assert game.text_entities == [MessageEntity("url", 1, 2)]
+    assert game.animation is None
+
+
+def test_structure_converts_ints_in_float_fields():
+    @dataclass
+    class Point:
+        latitude: float
+        tags: typing.List[str] = None
+
+    point = structure({"latitude": 10}, Point)
+
+    assert point.latitude == 10.0
+    assert type(point.latitude) is float
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+
+from GramBotPy.dispatcher import Dispatcher
+from GramBotPy.types.message import Message
+from GramBotPy.types.user import User
+
+
+class FakeClient:
+    def __init__(self):
+        self._me = None
+        self.get_me_calls = 0
+        
+    async def get_me(self):
+        self.get_me_calls += 1
+        if self._me is None:
+            self._me = User(id=1, is_bot=True, first_name="Bot", username="test_bot")
+        return self._me
+
+
+def make_message(client, text):
+    return Message._parse(client, {
+        "message_id": 1,
+        "date": 0,
+        "chat": {"id": 2, "type": "private"},
+        "text": text
+    })
+
+
+def dispatch(dispatcher, message):
+    asyncio.run(dispatcher.process_message(message))
+
+
+def test_command_handler_receives_arguments():
+    client = FakeClient()
+    dispatcher = Dispatcher(client)
+    received = []
+
+    @dispatcher.on_command("start")
+    async def start(message):
+        received.append(message.command_args)
+
+    dispatch(dispatcher, make_message(client, "/start  deep link"))
+    dispatch(dispatcher, make_message(client, "/start"))
+    dispatch(dispatcher, make_message(client, "/stop now"))
+
+    assert received == ["deep link", ""]
+
+
+def test_command_addressed_to_bot_resolves_me():
+    client = FakeClient()
+    dispatcher = Dispatcher(client)
+    received = []
+
+    @dispatcher.on_command("help")
+    async def help_command(message):
+        received.append(message.text)
+
+    dispatch(dispatcher, make_message(client, "/help@test_bot"))
+    dispatch(dispatcher, make_message(client, "/help@other_bot"))
+
+    assert received == ["/help@test_bot"]
+    assert client.get_me_calls == 2
+
+
+def test_handlers_run_in_registration_order():
+    client = FakeClient()
+    dispatcher = Dispatcher(client)
+    order = []
+
+    @dispatcher.on_message()
+    async def first(message):
+        order.append("message")
+
+    @dispatcher.on_command("start")
+    async def start(message):
+        order.append("command")
+
+    @dispatcher.on_message(lambda message: message.text.startswith("/"))
+    async def last(message):
+        order.append("filtered")
+
+    dispatch(dispatcher, make_message(client, "/start"))
+
+    assert order == ["message", "command", "filtered"]
+
+def test_update_task_releases_the_semaphore_it_acquired():
+    async def run():
+        client = FakeClient()
+        dispatcher = Dispatcher(client, max_concurrent_updates=1)
+        gate = asyncio.Event()
+
+        @dispatcher.on_message()
+        async def wait(message):
+            await gate.wait()
+
+        updates = [type("Update", (), {"update_id": 1, "message": make_message(client, "hi")})()]
+
+        async def get_updates(offset=None):
+            dispatcher._running = False
+            return updates
+
+        client.get_updates = get_updates
+        await dispatcher.start()
+        old_semaphore = dispatcher._update_semaphore
+        await dispatcher._update_handler_task
+        # stop() cancels the blocked task, whose callback runs after the restart
+        await dispatcher.stop()
+        await dispatcher.start()
+        dispatcher._running = False
+        new_semaphore = dispatcher._update_semaphore
+
+        gate.set()
+        await asyncio.gather(*dispatcher._update_tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        return old_semaphore, new_semaphore
+
+    old_semaphore, new_semaphore = asyncio.run(run())
+
+    assert not old_semaphore.locked()
+    assert new_semaphore._value == 1
\ No newline at end of file
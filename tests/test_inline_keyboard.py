@@ -0,0 +1,52 @@
+import dataclasses
+
+import pytest
+
+from GramBotPy.types.inline_keyboard_button import InlineKeyboardButton
+from GramBotPy.types.inline_keyboard_markup import InlineKeyboardMarkup
+from GramBotPy.utils.serialization import dumps, loads
+
+
+def test_button_to_dict_uses_its_kind():
+    button = InlineKeyboardButton("Open", url="https://telegram.org")
+
+    assert button.url == "https://telegram.org"
+    assert button.callback_data is None
+    assert button.to_dict() == {"text": "Open", "url": "https://telegram.org"}
+
+
+def test_button_is_immutable():
+    button = InlineKeyboardButton("Yes", callback_data="yes")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        button.text = "No"
+
+
+def test_button_round_trips_through_from_dict():
+    data = {"text": "Yes", "callback_data": "yes"}
+
+    assert InlineKeyboardButton._from_dict(data) == InlineKeyboardButton("Yes", callback_data="yes")
+
+
+def test_markup_converts_dict_buttons():
+    markup = InlineKeyboardMarkup([[{"text": "Yes", "callback_data": "yes"}]])
+
+    assert markup.inline_keyboard == [[InlineKeyboardButton("Yes", callback_data="yes")]]
+
+
+def test_to_json_follows_direct_mutation():
+    markup = InlineKeyboardMarkup.from_button(InlineKeyboardButton("Yes", callback_data="yes"))
+    markup.to_json()
+
+    markup.inline_keyboard[0].append(InlineKeyboardButton("No", callback_data="no"))
+
+    assert loads(markup.to_json()) == {
+        "inline_keyboard": [[{"text": "Yes", "callback_data": "yes"}, {"text": "No", "callback_data": "no"}]]
+    }
+
+
+def test_dumps_serializes_markups_like_to_json():
+    markup = InlineKeyboardMarkup.from_row([{"text": "A", "callback_data": "a"}]).row({"text": "B", "url": "https://b.org"})
+
+    assert dumps(markup) == markup.to_json()
+    assert loads(dumps({"reply_markup": markup}))["reply_markup"] == markup.to_dict()
\ No newline at end of file
@@ -0,0 +1,34 @@
+from GramBotPy.types.message_entity import ENTITY_TYPES, MessageEntity
+from GramBotPy.types.user import User
+from GramBotPy.utils.serialization import dumps, loads
+
+
+def test_type_id_follows_type():
+    entity = MessageEntity("bold", 0, 4)
+    assert entity.type_id == ENTITY_TYPES.index("bold")
+
+    entity.type = "italic"
+    assert entity.type_id == ENTITY_TYPES.index("italic")
+
+
+def test_unknown_type_has_negative_type_id():
+    assert MessageEntity("date_time", 0, 4).type_id == -1
+
+
+def test_to_dict_includes_only_set_fields():
+    entity = MessageEntity("text_link", 2, 5, url="https://telegram.org")
+
+    assert entity.to_dict() == {"type": "text_link", "offset": 2, "length": 5, "url": "https://telegram.org"}
+
+
+def test_to_dict_round_trips_through_json():
+    data = {
+        "type": "text_mention",
+        "offset": 0,
+        "length": 3,
+        "user": {"id": 1, "is_bot": False, "first_name": "Ann"}
+    }
+    entity = MessageEntity._from_dict(data)
+
+    assert isinstance(entity.user, User)
+    assert MessageEntity._from_dict(loads(dumps(entity.to_dict()))) == entity
\ No newline at end of file
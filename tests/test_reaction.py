@@ -0,0 +1,27 @@
+import dataclasses
+
+import pytest
+
+from GramBotPy.types.reaction import MessageReaction, ReactionType, ReactionTypeCustomEmoji, ReactionTypeEmoji
+
+
+def test_emoji_reactions_are_shared_and_immutable():
+    first = ReactionType._parse({"type": "emoji", "emoji": "👍"})
+    second = ReactionType._parse({"type": "emoji", "emoji": "👍"})
+
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.emoji = "👎"
+
+
+def test_reaction_types_dispatch_on_type():
+    assert ReactionType._parse({"type": "emoji", "emoji": "🔥"}) == ReactionTypeEmoji("🔥")
+    custom = ReactionType._parse({"type": "custom_emoji", "custom_emoji_id": "42"})
+    assert isinstance(custom, ReactionTypeCustomEmoji)
+    assert ReactionType._parse({"type": "paid"}).type == "paid"
+
+
+def test_message_reaction_to_dict():
+    reaction = MessageReaction._parse({"type": {"type": "emoji", "emoji": "🔥"}, "total_count": 3, "is_me": True})
+
+    assert reaction.to_dict() == {"type": {"type": "emoji", "emoji": "🔥"}, "total_count": 3, "is_me": True}
\ No newline at end of file
@@ -0,0 +1,44 @@
+from GramBotPy.utils import escape_html, escape_markdown
+from GramBotPy.utils import text_formatting
+
+
+def test_escape_markdown_v1():
+    assert escape_markdown("*bold* _italic_ [a](b)") == "\\*bold\\* \\_italic\\_ \\[a\\]\\(b\\)"
+
+
+def test_escape_markdown_v2_escapes_backslash():
+    assert escape_markdown("a\\b.c!", version=2) == "a\\\\b\\.c\\!"
+
+
+def test_escape_markdown_converts_non_strings():
+    assert escape_markdown(1.5, version=2) == "1\\.5"
+
+
+def test_escape_html():
+    assert escape_html("<b>Tom & Jerry</b>") == "&lt;b&gt;Tom &amp; Jerry&lt;/b&gt;"
+
+
+def test_escape_html_returns_clean_text_unchanged():
+    text = "plain text"
+
+    assert escape_html(text) is text
+
+
+def test_long_texts_are_escaped_without_caching():
+    text_formatting._escape_markdown_v2.cache_clear()
+    text_formatting._escape_html_cached.cache_clear()
+    long_text = "<a>." * 40
+
+    assert escape_markdown(long_text, version=2) == "<a\\>\\." * 40
+    assert escape_html(long_text) == "&lt;a&gt;." * 40
+    assert text_formatting._escape_markdown_v2.cache_info().currsize == 0
+    assert text_formatting._escape_html_cached.cache_info().currsize == 0
+
+
+def test_short_texts_are_cached():
+    text_formatting._escape_markdown_v1.cache_clear()
+
+    escape_markdown("/start")
+    escape_markdown("/start")
+
+    assert text_formatting._escape_markdown_v1.cache_info().hits == 1
\ No newline at end of file
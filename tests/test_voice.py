@@ -0,0 +1,20 @@
+from GramBotPy.types.voice import Voice
+
+
+def test_known_mime_types_share_one_string():
+    first = Voice("a", "b", 1, mime_type="".join(["audio/", "ogg"]))
+    second = Voice("c", "d", 2, mime_type="".join(["audio/", "ogg"]))
+
+    assert first.mime_type is second.mime_type
+
+
+def test_unknown_mime_types_are_kept_as_sent():
+    mime_type = "".join(["audio/", "x-custom"])
+
+    assert Voice("a", "b", 1, mime_type=mime_type).mime_type is mime_type
+
+
+def test_ids_are_kept_as_sent():
+    file_id = "".join(["AwAC", "1234"])
+
+    assert Voice(file_id, "b", 1).file_id is file_id
\ No newline at end of file